@@ -30,6 +30,10 @@ TEST_FILES = [
     "docker-compose.yml",
     "scripts"
 ]
+# UI files that are compiled into python modules when building the plugin
+COMPILED_UI_FILES = [
+    "result_item_widget",
+]
 app = typer.Typer()
 
 
@@ -197,6 +201,7 @@ def build(
     if icon_path is None:
         _log("Could not copy icon", context=context)
     compile_resources(context, output_directory)
+    compile_ui(context, output_directory)
     generate_metadata(context, output_directory)
     return output_directory
 
@@ -276,6 +281,30 @@ def compile_resources(
     subprocess.run(shlex.split(f"pyrcc5 -o {target_path} {resources_path}"))
 
 
+@app.command()
+def compile_ui(
+        context: typer.Context,
+        output_directory: typing.Optional[Path] = LOCAL_ROOT_DIR / "build/temp",
+):
+    """ Compiles the plugin UI files that are used for building many widgets
+    instances into python modules using the pyuic package, so the UI files
+    don't need to be parsed when the plugin is loaded.
+
+    :param context: Application context
+    :type context: typer.Context
+
+    :param output_directory: Output directory where the compiled UI
+    modules will be saved.
+    :type output_directory: Path
+    """
+    for ui_name in COMPILED_UI_FILES:
+        ui_path = LOCAL_ROOT_DIR / "src" / SRC_NAME / "ui" / f"{ui_name}.ui"
+        target_path = output_directory / "ui" / f"{ui_name}_ui.py"
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        _log(f"compile_ui target_path: {target_path}", context=context)
+        subprocess.run(shlex.split(f"pyuic5 -o {target_path} {ui_path}"))
+
+
 @app.command()
 def generate_metadata(
         context: typer.Context,
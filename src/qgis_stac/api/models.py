@@ -318,6 +318,8 @@ class Item:
     assets: typing.Dict[str, ResourceAsset] = None
     collection: str = None
     stac_object: STACObject = None
+    footprint_data: typing.Optional[bytes] = None
+    footprint_layer_id: typing.Optional[str] = None
 
 
 @dataclasses.dataclass
@@ -799,20 +799,44 @@ class SettingsManager(QtCore.QObject):
         :param connection: Connection settings
         :type connection:  ConnectionSettings
         """
-        for item in items:
-            item_setting = ItemSettings(
-                item_uuid=item.item_uuid,
-                id=item.id,
-                assets=item.assets,
-                stac_object=item.stac_object
-            )
-            self.save_item(connection, item_setting, page)
+        self.save_items_bulk(connection, {page: items})
+
+    def save_items_bulk(self, connection, pages_items):
+        """ Save the passed items of several result pages into the plugin
+        connection settings, all the items are written through one
+        settings instance which is synced once at the end.
+
+        :param connection: Connection settings
+        :type connection:  ConnectionSettings
+
+        :param pages_items: Items to be saved, keyed by their result page
+        :type pages_items: dict
+        """
+        settings = QgsSettings()
+        for page, items in pages_items.items():
+            for item in items:
+                item_setting = ItemSettings(
+                    item_uuid=item.item_uuid,
+                    id=item.id,
+                    assets=item.assets,
+                    stac_object=item.stac_object
+                )
+                self.save_item(
+                    connection,
+                    item_setting,
+                    page,
+                    settings=settings
+                )
+        settings.sync()
 
-    def save_item(self, connection, item_settings, page):
+    def save_item(self, connection, item_settings, page, settings=None):
         """ Save the passed item settings into the plugin settings
 
         :param connection: Connection settings
         :type connection:  ConnectionSettings
+
+        :param settings: QGIS settings to use
+        :type settings: QgsSettings
         """
         settings_key = self._get_item_settings_base(
             connection.id,
@@ -820,14 +844,14 @@ class SettingsManager(QtCore.QObject):
             item_settings.item_uuid
         )
 
-        with qgis_settings(settings_key) as settings:
-            settings.setValue("id", item_settings.id)
-            settings.setValue("item_uuid", item_settings.item_uuid)
-            settings.setValue("stac_version", item_settings.stac_version)
-            settings.setValue("stac_object", item_settings.stac_object)
-        self.save_item_assets(item_settings.assets, settings_key)
+        with qgis_settings(settings_key, settings) as item_group:
+            item_group.setValue("id", item_settings.id)
+            item_group.setValue("item_uuid", item_settings.item_uuid)
+            item_group.setValue("stac_version", item_settings.stac_version)
+            item_group.setValue("stac_object", item_settings.stac_object)
+        self.save_item_assets(item_settings.assets, settings_key, settings)
 
-    def save_item_assets(self, assets, key):
+    def save_item_assets(self, assets, key, settings=None):
         """ Saves the collection provider into plugin settings
         using the provided settings group key.
 
@@ -836,16 +860,19 @@ class SettingsManager(QtCore.QObject):
 
         :param key: QgsSettings group key.
         :type key: str
+
+        :param settings: QGIS settings to use
+        :type settings: QgsSettings
         """
         for asset in assets or []:
             asset_uuid = uuid.uuid4()
             settings_key = f"{key}/{self.ASSETS_GROUP_NAME}/{asset_uuid}"
-            with qgis_settings(settings_key) as settings:
-                settings.setValue("title", asset.title)
-                settings.setValue("description", asset.description)
-                settings.setValue("href", asset.href)
-                settings.setValue("roles", asset.roles)
-                settings.setValue("type", asset.type)
+            with qgis_settings(settings_key, settings) as asset_group:
+                asset_group.setValue("title", asset.title)
+                asset_group.setValue("description", asset.description)
+                asset_group.setValue("href", asset.href)
+                asset_group.setValue("roles", asset.roles)
+                asset_group.setValue("type", asset.type)
 
     def get_collection(self, identifier, connection):
         """ Retrieves the collection that matches the passed identifier.
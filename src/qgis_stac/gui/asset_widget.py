@@ -23,6 +23,18 @@ WidgetUi, _ = loadUiType(
     os.path.join(os.path.dirname(__file__), "../ui/asset_widget.ui")
 )
 
+# Media types of the assets that can be loaded as QGIS map layers
+LAYER_TYPES = (
+    AssetLayerType.COG.value,
+    AssetLayerType.COPC.value,
+    AssetLayerType.GEOTIFF.value,
+    AssetLayerType.NETCDF.value,
+)
+
+# Joined layer media types, an asset type is loadable when it is
+# part of this text.
+LAYER_TYPES_TEXT = ''.join(LAYER_TYPES)
+
 
 class AssetWidget(QtWidgets.QWidget, WidgetUi):
     """ Widget that provide UI for asset details,
@@ -71,15 +83,8 @@ class AssetWidget(QtWidgets.QWidget, WidgetUi):
     def asset_loadable(self):
         """ Returns if asset can be added into QGIS"""
 
-        layer_types = [
-            AssetLayerType.COG.value,
-            AssetLayerType.COPC.value,
-            AssetLayerType.GEOTIFF.value,
-            AssetLayerType.NETCDF.value,
-        ]
-
         if self.asset.type is not None:
-            return self.asset.type in ''.join(layer_types)
+            return self.asset.type in LAYER_TYPES_TEXT
         else:
             try:
                 request = QtNetwork.QNetworkRequest(
@@ -94,7 +99,7 @@ class AssetWidget(QtWidgets.QWidget, WidgetUi):
                 )
                 content_type = str(content_type, 'utf-8')
 
-                for layer_type in layer_types:
+                for layer_type in LAYER_TYPES:
                     layer_type_values = layer_type.split(' ')
                     for value in layer_type_values:
                         if value in content_type:
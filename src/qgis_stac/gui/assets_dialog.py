@@ -3,6 +3,8 @@
     Assets dialog, shows all the available assets.
 """
 
+import collections
+import contextlib
 import os
 import os.path
 
@@ -11,8 +13,6 @@ from osgeo import ogr, gdal
 
 from functools import partial
 
-from qgis import processing
-
 from qgis.PyQt import QtCore, QtGui, QtWidgets
 from qgis.PyQt.uic import loadUiType
 
@@ -51,7 +51,7 @@ from ..conf import (
     settings_manager
 )
 
-from .asset_widget import AssetWidget
+from .asset_widget import AssetWidget, LAYER_TYPES_TEXT
 
 from ..utils import log, tr
 
@@ -59,6 +59,153 @@ DialogUi, _ = loadUiType(
     os.path.join(os.path.dirname(__file__), "../ui/item_assets_widget.ui")
 )
 
+# GDAL virtual file system prefix for reading remote files
+VSI_CURL_PREFIX = '/vsicurl/'
+
+# Asset media types grouped by the QGIS map layer type they are loaded as
+RASTER_TYPES = ','.join([
+    AssetLayerType.COG.value,
+    AssetLayerType.GEOTIFF.value,
+    AssetLayerType.NETCDF.value
+])
+VECTOR_TYPES = ','.join([
+    AssetLayerType.GEOJSON.value,
+    AssetLayerType.GEOPACKAGE.value
+])
+POINT_CLOUD_TYPES = ','.join([
+    AssetLayerType.COPC.value,
+])
+
+# GDAL options for reading remote assets, they let GDAL reuse the HTTP
+# connections and cache the already read blocks between layer loads.
+# The options only apply to the loaded assets hosts, options that have
+# been set by the user are left unchanged.
+GDAL_REMOTE_OPTIONS = {
+    "GDAL_HTTP_MULTIPLEX": "YES",
+    "GDAL_HTTP_VERSION": "2",
+    "VSI_CACHE": "YES",
+    "VSI_CACHE_SIZE": "67108864",
+}
+
+# Interval in milliseconds between the layer loading progress bar updates
+PROGRESS_UPDATE_INTERVAL = 50
+
+# Maximum number of layer loading tasks running at the same time,
+# the remaining tasks wait in the queue until a running task is done.
+MAX_RUNNING_LAYER_LOADERS = 4
+
+_queued_layer_loaders = collections.deque()
+_running_layer_loaders = set()
+
+
+def remote_options_prefix(layer_uri):
+    """ Returns the GDAL path prefix of the host serving the layer.
+
+    :param layer_uri: Layer data source URI
+    :type layer_uri: str
+
+    :returns GDAL virtual file system prefix of the layer host, None for
+     layers that are not read over HTTP
+    :rtype str
+    """
+    if layer_uri.startswith(VSI_CURL_PREFIX):
+        layer_uri = layer_uri[len(VSI_CURL_PREFIX):]
+    url = QtCore.QUrl(layer_uri)
+    if url.scheme() not in ("http", "https") or not url.host():
+        return None
+    host_url = url.toString(
+        QtCore.QUrl.RemoveUserInfo |
+        QtCore.QUrl.RemovePath |
+        QtCore.QUrl.RemoveQuery |
+        QtCore.QUrl.RemoveFragment
+    )
+    return f"{VSI_CURL_PREFIX}{host_url}/"
+
+
+@contextlib.contextmanager
+def gdal_remote_options(layer_uri):
+    """ Context manager that applies the GDAL remote options while the
+    layer is being opened.
+
+    With GDAL 3.6 or later the options are set for the layer host path
+    prefix, so they also apply when the layer data is read later on.
+    Older GDAL versions get them as thread local options that are
+    restored once the layer has been opened.
+
+    :param layer_uri: Layer data source URI
+    :type layer_uri: str
+    """
+    prefix = remote_options_prefix(layer_uri)
+    options = {
+        option: value
+        for option, value in GDAL_REMOTE_OPTIONS.items()
+        if gdal.GetConfigOption(option) is None
+    }
+    if prefix is None or not options:
+        yield
+        return
+
+    if hasattr(gdal, "SetPathSpecificOption"):
+        for option, value in options.items():
+            gdal.SetPathSpecificOption(prefix, option, value)
+        yield
+        return
+
+    previous_options = {
+        option: gdal.GetThreadLocalConfigOption(option, None)
+        for option in options
+    }
+    for option, value in options.items():
+        gdal.SetThreadLocalConfigOption(option, value)
+    try:
+        yield
+    finally:
+        for option, value in previous_options.items():
+            gdal.SetThreadLocalConfigOption(option, value)
+
+
+def queue_layer_loader(layer_loader):
+    """ Adds the layer loader task into the loading queue and starts it
+    if the running tasks limit has not been reached.
+
+    :param layer_loader: Plugin QGIS task responsible for loading assets
+    as layers.
+    :type layer_loader: LayerLoader
+    """
+    _queued_layer_loaders.append(layer_loader)
+    start_queued_layer_loaders()
+
+
+def start_queued_layer_loaders():
+    """ Submits the queued layer loader tasks to the QGIS task manager,
+    up to the running tasks limit.
+    """
+    while _queued_layer_loaders and \
+            len(_running_layer_loaders) < MAX_RUNNING_LAYER_LOADERS:
+        layer_loader = _queued_layer_loaders.popleft()
+        _running_layer_loaders.add(layer_loader)
+
+        layer_loader_done = partial(
+            finish_layer_loader,
+            layer_loader
+        )
+        layer_loader.taskCompleted.connect(layer_loader_done)
+        layer_loader.taskTerminated.connect(layer_loader_done)
+
+        QgsApplication.taskManager().addTask(layer_loader)
+
+
+def finish_layer_loader(layer_loader):
+    """ Releases the finished layer loader task slot and starts
+    the next queued task.
+
+    :param layer_loader: Plugin QGIS task responsible for loading assets
+    as layers.
+    :type layer_loader: LayerLoader
+    """
+    _running_layer_loaders.discard(layer_loader)
+    start_queued_layer_loaders()
+
 
 class AssetsDialog(QtWidgets.QDialog, DialogUi):
     """ Dialog for adding and downloading STAC Item assets"""
@@ -86,11 +233,16 @@ class AssetsDialog(QtWidgets.QDialog, DialogUi):
         self.assets = item.assets
         self.parent = parent
         self.main_widget = main_widget
-        self.vis_url_string = '/vsicurl/'
         self.download_result = {}
         self.load_assets = {}
         self.download_assets = {}
 
+        self.last_progress = 0
+        self.progress_changed = False
+        self.progress_timer = QtCore.QTimer(self)
+        self.progress_timer.setInterval(PROGRESS_UPDATE_INTERVAL)
+        self.progress_timer.timeout.connect(self.flush_progress)
+
         self.load_btn.clicked.connect(self.load_btn_clicked)
         self.download_btn.clicked.connect(self.download_btn_clicked)
 
@@ -340,12 +492,6 @@ class AssetsDialog(QtWidgets.QDialog, DialogUi):
 
         self.download_result["file"] = output
 
-        layer_types = [
-            AssetLayerType.COG.value,
-            AssetLayerType.COPC.value,
-            AssetLayerType.GEOTIFF.value,
-            AssetLayerType.NETCDF.value,
-        ]
         try:
             self.main_widget.show_message(
                 tr("Download for file {} to {} has started."
@@ -366,6 +512,10 @@ class AssetsDialog(QtWidgets.QDialog, DialogUi):
             )
             feedback.progressChanged.connect(self.download_progress)
 
+            # Processing is only imported when the first download is
+            # started, it is not needed for loading the plugin.
+            from qgis import processing
+
             results = processing.run(
                 "qgis:filedownloader",
                 params,
@@ -374,7 +524,7 @@ class AssetsDialog(QtWidgets.QDialog, DialogUi):
 
             # After asset download has finished, load the asset
             # if it can be loaded as a QGIS map layer.
-            if results and load_asset and asset.type in ''.join(layer_types):
+            if results and load_asset and asset.type in LAYER_TYPES_TEXT:
                 asset.href = self.download_result["file"]
                 asset.name = title
                 asset.type = AssetLayerType.GEOTIFF.value \
@@ -458,36 +608,20 @@ class AssetsDialog(QtWidgets.QDialog, DialogUi):
         """
 
         asset_type = asset.type
-        raster_types = ','.join([
-            AssetLayerType.COG.value,
-            AssetLayerType.GEOTIFF.value,
-            AssetLayerType.NETCDF.value
-        ])
-        vector_types = ','.join([
-            AssetLayerType.GEOJSON.value,
-            AssetLayerType.GEOPACKAGE.value
-        ])
-        point_cloud_types = ','.join([
-            AssetLayerType.COPC.value,
-        ])
         current_asset_href = asset.href
         asset.href = self.sign_asset_href(asset.href)
 
-        if asset_type in raster_types:
+        if asset_type in RASTER_TYPES:
             layer_type = QgsMapLayer.RasterLayer
-        elif asset_type in vector_types:
+        elif asset_type in VECTOR_TYPES:
             layer_type = QgsMapLayer.VectorLayer
-        elif asset_type in point_cloud_types:
+        elif asset_type in POINT_CLOUD_TYPES:
             layer_type = QgsMapLayer.PointCloudLayer
 
-        if asset_type in ''.join(
-                [AssetLayerType.COG.value]
-        ) and \
+        if asset_type in AssetLayerType.COG.value and \
                 asset_type != AssetLayerType.GEOTIFF.value:
-            asset_href = f"{self.vis_url_string}" \
-                         f"{asset.href}"
-        elif asset_type in ''.join([
-            AssetLayerType.NETCDF.value]):
+            asset_href = f"{VSI_CURL_PREFIX}{asset.href}"
+        elif asset_type in AssetLayerType.NETCDF.value:
             # For NETCDF assets type we need to download the intended asset first,
             # then we read from the downloaded file and use all the available NETCDF
             # variables on the file to load the layer.
@@ -561,10 +695,13 @@ class AssetsDialog(QtWidgets.QDialog, DialogUi):
         # task as the callback function approach doesn't make the task
         # to recall the assigned callbacks in the provided context.
         layer_loader.taskCompleted.connect(add_layer_partial)
-        layer_loader.progressChanged.connect(self.main_widget.update_progress_bar)
+        layer_loader.progressChanged.connect(
+            self.queue_progress,
+            QtCore.Qt.QueuedConnection
+        )
         layer_loader.taskTerminated.connect(self.layer_loader_terminated)
 
-        QgsApplication.taskManager().addTask(layer_loader)
+        queue_layer_loader(layer_loader)
 
         self.main_widget.show_progress(
             f"Adding asset \"{asset_name}\" into QGIS",
@@ -574,6 +711,28 @@ class AssetsDialog(QtWidgets.QDialog, DialogUi):
         self.main_widget.update_progress_bar(0)
         log(tr("Started adding asset into QGIS"))
 
+    def queue_progress(self, value):
+        """ Stores the latest layer loading progress value, the progress bar
+        is updated with it on the next progress timer tick.
+
+        :param value: Progress value
+        :type value: float
+        """
+        self.last_progress = value
+        self.progress_changed = True
+        if not self.progress_timer.isActive():
+            self.progress_timer.start()
+
+    def flush_progress(self):
+        """ Updates the progress bar with the latest progress value,
+        stops the progress timer when no new value has been received.
+        """
+        if not self.progress_changed:
+            self.progress_timer.stop()
+            return
+        self.progress_changed = False
+        self.main_widget.update_progress_bar(self.last_progress)
+
     def add_layer(self, asset_name, layer_loader):
         """ Adds layer into the current QGIS project.
             For the layer to be added successfully, the task for loading
@@ -665,12 +824,24 @@ class LayerLoader(QgsTask):
         log(
             tr("Fetching layers in a background task.")
         )
+        with gdal_remote_options(self.layer_uri):
+            return self.load_layer()
+
+    def load_layer(self):
+        """ Loads the layer from its data source.
+
+        :returns Whether the layer has been loaded
+        :rtype bool
+        """
         if self.layer_type is QgsMapLayer.RasterLayer:
             self.layer = QgsRasterLayer(
                 self.layer_uri,
                 self.layer_name
             )
-            return self.layer.isValid()
+            result = self.layer.isValid()
+            if result:
+                self.move_layer_to_main_thread()
+            return result
         elif self.layer_type is QgsMapLayer.VectorLayer:
             extension = Path(self.layer_uri).suffix
             result = False
@@ -703,12 +874,22 @@ class LayerLoader(QgsTask):
                 self.layer_name,
                 'copc'
             )
-            return self.layer.isValid()
+            result = self.layer.isValid()
+            if result:
+                self.move_layer_to_main_thread()
+            return result
         else:
             raise NotImplementedError
 
         return False
 
+    def move_layer_to_main_thread(self):
+        """ Hands the loaded layer over to the main thread, so it can be
+        added into the QGIS project without reopening its data source.
+        Must be called from the task thread, which owns the layer.
+        """
+        self.layer.moveToThread(QgsApplication.instance().thread())
+
     def finished(self, result: bool):
         """ Calls the handler responsible for adding the
          layer into QGIS project.
@@ -721,12 +902,14 @@ class LayerLoader(QgsTask):
                 f"Fetched layer with URI "
                 f"{self.layer_uri} "
             )
-            # Due to the way QGIS is handling layers sharing between tasks and
-            # the main thread, sending the layer to the main thread
-            # without cloning it can lead to unpredicted crashes,
-            # hence we clone the layer before storing it, so it can
-            # be used in the main thread.
-            self.layer = self.layer.clone()
+            # Raster and point cloud layers have already been moved to the
+            # main thread at the end of run(). The OGR based vector layers
+            # are not safe to share between the task and the main thread,
+            # sending them without cloning can lead to unpredicted crashes,
+            # hence we clone them before storing, so they can be used
+            # in the main thread.
+            if self.layer_type is QgsMapLayer.VectorLayer:
+                self.layer = self.layer.clone()
         else:
             provider_error = tr("error {}").format(
                 self.layer.dataProvider().error()
@@ -54,13 +54,23 @@ from ..utils import (
     tr,
 )
 
-from .result_item_widget import add_footprint_helper, ResultItemWidget
+from .result_item_widget import (
+    add_footprint_helper,
+    ResultItemWidget,
+    ThumbnailFetcher,
+)
 
 WidgetUi, _ = loadUiType(
     os.path.join(os.path.dirname(__file__), "../ui/qgis_stac_main.ui")
 )
 
 
+# Number of search result widgets that are created at a time, the
+# following batch is created when the user scrolls close to the end of
+# the results list.
+RESULT_WIDGETS_BATCH_SIZE = 5
+
+
 class QgisStacWidget(QtWidgets.QMainWindow, WidgetUi):
     """ Main plugin UI that contains tabs for search, results and settings
     functionalities"""
@@ -218,6 +228,12 @@ class QgisStacWidget(QtWidgets.QMainWindow, WidgetUi):
         self.queryable_property_widgets = []
         self.queryable_properties = []
 
+        self.pending_results = []
+        self.results_layout = None
+        self.scroll_area.verticalScrollBar().valueChanged.connect(
+            self.results_scrolled
+        )
+
     def prepare_plugin_settings(self):
         """ Initializes all the plugin related settings"""
 
@@ -798,17 +814,48 @@ class QgisStacWidget(QtWidgets.QMainWindow, WidgetUi):
 
     def populate_results(self, results):
         """ Add the found results into the widget scroll area.
+        Only the first batch of the result widgets is created here, the
+        rest are created when they are about to be scrolled into view.
 
         :param results: List of items results
         :type results: list
         """
 
+        # Thumbnails requested for the previous results widgets
+        # are no longer needed.
+        ThumbnailFetcher.instance().cancel_all()
+
         self.result_items = results
+        self.pending_results = list(results)
         scroll_container = QtWidgets.QWidget()
         layout = QtWidgets.QVBoxLayout()
         layout.setContentsMargins(1, 1, 1, 1)
         layout.setSpacing(1)
-        for result in results:
+        vertical_spacer = QtWidgets.QSpacerItem(
+            20,
+            40,
+            QtWidgets.QSizePolicy.Minimum,
+            QtWidgets.QSizePolicy.Expanding
+        )
+        layout.addItem(vertical_spacer)
+        scroll_container.setLayout(layout)
+        self.results_layout = layout
+        self.add_result_widgets()
+
+        self.scroll_area.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setWidget(scroll_container)
+
+        QtCore.QTimer.singleShot(0, self.fill_results_view)
+
+    def add_result_widgets(self):
+        """ Creates the next batch of the pending search result widgets
+        and adds them before the results layout spacer.
+        """
+        batch = self.pending_results[:RESULT_WIDGETS_BATCH_SIZE]
+        self.pending_results = self.pending_results[RESULT_WIDGETS_BATCH_SIZE:]
+
+        for result in batch:
             search_result_widget = ResultItemWidget(
                 result,
                 main_widget=self,
@@ -829,19 +876,35 @@ class QgisStacWidget(QtWidgets.QMainWindow, WidgetUi):
                 footprint_deselected_partial
             )
 
-            layout.addWidget(search_result_widget)
-            layout.setAlignment(search_result_widget, QtCore.Qt.AlignTop)
-        vertical_spacer = QtWidgets.QSpacerItem(
-            20,
-            40,
-            QtWidgets.QSizePolicy.Minimum,
-            QtWidgets.QSizePolicy.Expanding
-        )
-        layout.addItem(vertical_spacer)
-        scroll_container.setLayout(layout)
-        self.scroll_area.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setWidget(scroll_container)
+            self.results_layout.insertWidget(
+                self.results_layout.count() - 1,
+                search_result_widget
+            )
+            self.results_layout.setAlignment(
+                search_result_widget,
+                QtCore.Qt.AlignTop
+            )
+
+    def results_scrolled(self, value):
+        """ Creates the next batch of result widgets when the results
+        scroll area has been scrolled close to its end.
+
+        :param value: Vertical scroll bar position
+        :type value: int
+        """
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        if self.pending_results and \
+                value >= scroll_bar.maximum() - scroll_bar.pageStep():
+            self.add_result_widgets()
+
+    def fill_results_view(self):
+        """ Keeps creating result widgets until the results scroll area
+        can be scrolled or there are no more pending results.
+        """
+        if self.pending_results and \
+                self.scroll_area.verticalScrollBar().maximum() == 0:
+            self.add_result_widgets()
+            QtCore.QTimer.singleShot(0, self.fill_results_view)
 
     def footprint_selected(self, item):
         """ Adds the passed item to the list of the
@@ -905,6 +968,9 @@ class QgisStacWidget(QtWidgets.QMainWindow, WidgetUi):
         self.scroll_area.setWidget(QtWidgets.QWidget())
         self.result_items_la.clear()
         self.result_items = []
+        self.pending_results = []
+        self.results_layout = None
+        ThumbnailFetcher.instance().cancel_all()
 
     def filter_changed(self, filter_text):
         """
@@ -25,6 +25,48 @@ WidgetUi, _ = loadUiType(
     os.path.join(os.path.dirname(__file__), "../ui/queryable_property.ui")
 )
 
+_PREFERRED_POLICY = None
+
+
+def _policy():
+    """ Returns the size policy shared by all the queryable property
+    widgets children, creating it on first use.
+
+    :returns Preferred size policy
+    :rtype QtWidgets.QSizePolicy
+    """
+    global _PREFERRED_POLICY
+    if _PREFERRED_POLICY is None:
+        _PREFERRED_POLICY = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Preferred,
+            QtWidgets.QSizePolicy.Preferred,
+        )
+    return _PREFERRED_POLICY
+
+
+def combo_model(entries, parent=None):
+    """ Builds a combo box model in one pass, the first row is left empty
+    so that the combo box can be used without a selected value.
+
+    :param entries: Pairs of the entries text and data
+    :type entries: list
+
+    :param parent: Parent object of the model
+    :type parent: QObject
+
+    :returns Combo box model
+    :rtype QtGui.QStandardItemModel
+    """
+    model = QtGui.QStandardItemModel(len(entries) + 1, 1, parent)
+    model.setItem(0, QtGui.QStandardItem(""))
+
+    for row, (text, data) in enumerate(entries, start=1):
+        model_item = QtGui.QStandardItem(text)
+        model_item.setData(data, QtCore.Qt.UserRole)
+        model.setItem(row, model_item)
+
+    return model
+
 
 class QueryablePropertyWidget(QtWidgets.QWidget, WidgetUi):
     """ Widget that provide UI for STAC queryable properties details.
@@ -45,10 +87,7 @@ class QueryablePropertyWidget(QtWidgets.QWidget, WidgetUi):
     def initialize_ui(self):
         """ Populate UI inputs when loading the widget"""
 
-        size_policy = QtWidgets.QSizePolicy(
-            QtWidgets.QSizePolicy.Preferred,
-            QtWidgets.QSizePolicy.Preferred,
-        )
+        size_policy = _policy()
 
         label = QtWidgets.QLabel(self.queryable_property.name)
         label.setSizePolicy(size_policy)
@@ -78,10 +117,18 @@ class QueryablePropertyWidget(QtWidgets.QWidget, WidgetUi):
             cmb_box = QtWidgets.QComboBox()
             cmb_box.setSizePolicy(size_policy)
 
-            cmb_box.addItem("")
-            for enum_value in self.queryable_property.values:
-                cmb_box.addItem(enum_value, enum_value)
+            cmb_box.blockSignals(True)
+            cmb_box.setModel(
+                combo_model(
+                    [
+                        (enum_value, enum_value)
+                        for enum_value in self.queryable_property.values
+                    ],
+                    parent=cmb_box
+                )
+            )
             cmb_box.setCurrentIndex(0)
+            cmb_box.blockSignals(False)
 
             input_layout.addWidget(cmb_box)
             self.input_widget = cmb_box
@@ -107,10 +154,15 @@ class QueryablePropertyWidget(QtWidgets.QWidget, WidgetUi):
             FilterOperator.GREATER_THAN_EQUAL: tr(">="),
             FilterOperator.EQUAL: tr("="),
         }
-        self.operator_cmb.addItem("")
-        for operator, label in labels.items():
-            self.operator_cmb.addItem(label, operator)
+        self.operator_cmb.blockSignals(True)
+        self.operator_cmb.setModel(
+            combo_model(
+                [(label, operator) for operator, label in labels.items()],
+                parent=self.operator_cmb
+            )
+        )
         self.operator_cmb.setCurrentIndex(0)
+        self.operator_cmb.blockSignals(False)
 
     def filter_text(self):
         """ Returns a cql-text representation of the property and the
@@ -4,12 +4,9 @@
 """
 
 
-import datetime
-import json
+import collections
+import hashlib
 import os
-import tempfile
-
-from functools import partial
 
 from qgis.PyQt import (
     QtCore,
@@ -22,21 +19,19 @@ from qgis.PyQt.uic import loadUiType
 from qgis.core import (
     Qgis,
     QgsApplication,
-    QgsMapLayer,
-    QgsNetworkContentFetcherTask,
+    QgsCoordinateReferenceSystem,
+    QgsJsonUtils,
+    QgsMemoryProviderUtils,
+    QgsNetworkAccessManager,
     QgsProject,
-    QgsRasterLayer,
-    QgsTask,
-    QgsVectorLayer,
+    QgsWkbTypes,
 )
 from ..lib import planetary_computer as pc
 
 try:
-    import urlparse
-    from urllib import urlencode
-except: # For Python 3
-    import urllib.parse as urlparse
-    from urllib.parse import urlencode
+    import orjson
+except ImportError:
+    orjson = None
 
 
 from ..resources import *
@@ -45,7 +40,6 @@ from ..definitions.constants import SAS_SUBSCRIPTION_VARIABLE
 
 from ..api.models import (
     ApiCapability,
-    AssetLayerType,
     AssetRoles,
     ResourceAsset
 )
@@ -56,10 +50,182 @@ from .assets_dialog import AssetsDialog
 from ..definitions import constants
 
 
-WidgetUi, _ = loadUiType(
-    os.path.join(os.path.dirname(__file__), "../ui/result_item_widget.ui")
+# The compiled UI module is generated when building the plugin, fall back
+# to loading the UI file when running from the source tree.
+try:
+    from ..ui.result_item_widget_ui import Ui_ResultItemWidget as WidgetUi
+except ImportError:
+    WidgetUi, _ = loadUiType(
+        os.path.join(os.path.dirname(__file__), "../ui/result_item_widget.ui")
+    )
+
+# Thread pool used for decoding the thumbnails off the GUI thread
+_thumb_pool = QtCore.QThreadPool()
+_thumb_pool.setMaxThreadCount(max(2, os.cpu_count() or 1))
+
+# Asset roles used for finding the item thumbnail
+THUMBNAIL_ROLE = AssetRoles.THUMBNAIL.value
+OVERVIEW_ROLE = AssetRoles.OVERVIEW.value
+
+# Network reply success code, checked for every thumbnail response
+_NO_ERROR = QtNetwork.QNetworkReply.NoError
+
+# Size in kilobytes that the Qt pixmap cache is allowed to use, the
+# decoded thumbnails are kept there keyed by their cache key.
+PIXMAP_CACHE_LIMIT = 50 * 1024
+
+if QtGui.QPixmapCache.cacheLimit() < PIXMAP_CACHE_LIMIT:
+    QtGui.QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT)
+
+# Maximum size in bytes of the thumbnails disk cache
+THUMBNAIL_CACHE_MAX_SIZE = 100 * 1024 * 1024
+
+# Query parameters of the SAS token appended to the signed blob urls
+SAS_QUERY_PARAMS = (
+    "st", "se", "sp", "spr", "sv", "sr", "sig", "si", "sip", "ss",
+    "srt", "sdd", "skoid", "sktid", "skt", "ske", "sks", "skv",
 )
 
+_thumbnail_cache_dir = None
+
+
+def format_date(value):
+    """ Formats the date as month/day/year for the result item date label.
+
+    :param value: Date value, dates that are already text are kept as is.
+    :type value: datetime.datetime
+
+    :returns Formatted date
+    :rtype str
+    """
+    if isinstance(value, str):
+        return value
+    return f"{value.month:02d}/{value.day:02d}/{value.year:04d}"
+
+
+def footprint_data(item):
+    """ Returns the item GeoJSON encoded data used for its footprint layer,
+    the item is serialized only the first time its footprint is requested
+    and the data is kept on the item.
+
+    :param item: STAC item
+    :type item: Item
+
+    :returns GeoJSON encoded data
+    :rtype bytes
+    """
+    if item.footprint_data is None:
+        item_dict = item.stac_object.to_dict()
+        if orjson is not None:
+            item.footprint_data = orjson.dumps(item_dict)
+        else:
+            import json
+            item.footprint_data = json.dumps(
+                item_dict,
+                separators=(",", ":")
+            ).encode("utf-8")
+    return item.footprint_data
+
+
+def footprint_layer(item):
+    """ Creates the item footprint memory layer from the item GeoJSON,
+    the item properties are kept as the footprint feature attributes.
+
+    :param item: STAC item
+    :type item: Item
+
+    :returns Footprint layer
+    :rtype QgsVectorLayer
+    """
+    data = footprint_data(item).decode("utf-8")
+    codec = QtCore.QTextCodec.codecForName("UTF-8")
+
+    fields = QgsJsonUtils.stringToFields(data, codec)
+    features = QgsJsonUtils.stringToFeatureList(data, fields, codec)
+    geometry_type = features[0].geometry().wkbType() \
+        if features else QgsWkbTypes.Polygon
+
+    layer = QgsMemoryProviderUtils.createMemoryLayer(
+        f"{item.id}_footprint",
+        fields,
+        geometry_type,
+        QgsCoordinateReferenceSystem("EPSG:4326")
+    )
+    layer.dataProvider().addFeatures(features)
+    layer.updateExtents()
+    return layer
+
+
+def thumbnail_cache_dir():
+    """ Returns the thumbnails disk cache directory inside the QGIS
+    profile folder, creating it when first used. The cache is pruned
+    once per session in the thumbnails thread pool.
+
+    :returns Thumbnails cache directory path
+    :rtype str
+    """
+    global _thumbnail_cache_dir
+    if _thumbnail_cache_dir is None:
+        _thumbnail_cache_dir = os.path.join(
+            QgsApplication.qgisSettingsDirPath(),
+            "qgis_stac",
+            "thumbs"
+        )
+        QtCore.QDir().mkpath(_thumbnail_cache_dir)
+        _thumb_pool.start(ThumbnailCachePrune(_thumbnail_cache_dir))
+    return _thumbnail_cache_dir
+
+
+def thumbnail_cache_key(url):
+    """ Returns the key used to cache the thumbnail with the given url,
+    the SAS token query parameters are removed from the url as the token
+    changes with every session and refresh.
+
+    :param url: Thumbnail URL
+    :type url: str
+
+    :returns Thumbnail cache key
+    :rtype str
+    """
+    thumbnail_url = QtCore.QUrl(url)
+    query = QtCore.QUrlQuery(thumbnail_url)
+    for key in SAS_QUERY_PARAMS:
+        query.removeAllQueryItems(key)
+    thumbnail_url.setQuery(query)
+
+    return thumbnail_url.toString(QtCore.QUrl.FullyEncoded)
+
+
+def thumbnail_cache_path(key):
+    """ Returns the path of the disk cache file for the thumbnail key.
+
+    :param key: Thumbnail cache key
+    :type key: str
+
+    :returns Path of the cached thumbnail file
+    :rtype str
+    """
+    return os.path.join(
+        thumbnail_cache_dir(),
+        hashlib.sha1(key.encode("utf-8")).hexdigest()
+    )
+
+
+def write_thumbnail_cache(path, content):
+    """ Writes the downloaded thumbnail data into the disk cache file,
+    the file is replaced at once so it is never left half written.
+
+    :param path: Path of the thumbnail disk cache file
+    :type path: str
+
+    :param content: Thumbnail image data
+    :type content: QByteArray
+    """
+    cache_file = QtCore.QSaveFile(path)
+    if cache_file.open(QtCore.QIODevice.WriteOnly):
+        cache_file.write(content)
+        cache_file.commit()
+
 
 class ResultItemWidget(QtWidgets.QWidget, WidgetUi):
     """
@@ -83,13 +249,25 @@ class ResultItemWidget(QtWidgets.QWidget, WidgetUi):
         self.item = item
         self.title_la.setText(item.id)
         self.thumbnail_url = None
-        self.date_time_format = "%Y-%m-%dT%H:%M:%S"
-        self.simple_date_format = "%m/%d/%Y"
+        self.thumbnail_key = None
         self.main_widget = main_widget
         self.layer_loader = None
+        self.thumbnail_decode_signals = None
+        self.thumbnail_la.setScaledContents(False)
+        self.thumbnail_requested = False
         self.initialize_ui()
-        if self.thumbnail_url:
-            self.add_thumbnail()
+
+    def showEvent(self, event):
+        """ Loads the item thumbnail the first time the widget is shown,
+        so thumbnails are only fetched for the results being displayed.
+
+        :param event: Show event
+        :type event: QShowEvent
+        """
+        super().showEvent(event)
+        if self.thumbnail_url and not self.thumbnail_requested:
+            self.thumbnail_requested = True
+            QtCore.QTimer.singleShot(0, self.add_thumbnail)
 
     def initialize_ui(self):
         """ Populate UI inputs when loading the widget"""
@@ -97,25 +275,18 @@ class ResultItemWidget(QtWidgets.QWidget, WidgetUi):
         datetime_str = None
         if self.item.properties and \
             self.item.properties.start_date and \
-            self.item.proerties.end_date:
+            self.item.properties.end_date:
 
-            start_date = datetime.datetime.strftime(
-                self.item.properties.start_date,
-                self.simple_date_format
-            )
-            end_date = datetime.datetime.strftime(
-                self.item.properties.end_date,
-                self.simple_date_format
-            )
+            start_date = format_date(self.item.properties.start_date)
+            end_date = format_date(self.item.properties.end_date)
 
             datetime_str = f"{start_date} - {end_date}"
 
         elif self.item.properties and \
                 self.item.properties.resource_datetime:
 
-            datetime_str = datetime.datetime.strftime(
-                self.item.properties.resource_datetime,
-                self.simple_date_format
+            datetime_str = format_date(
+                self.item.properties.resource_datetime
             )
 
         self.created_date.setText(
@@ -156,10 +327,10 @@ class ResultItemWidget(QtWidgets.QWidget, WidgetUi):
         overview_url = None
 
         for asset in self.item.assets:
-            if AssetRoles.THUMBNAIL.value in asset.roles:
+            if THUMBNAIL_ROLE in asset.roles:
                 thumbnail_url = self.sign_asset_href(asset.href)
 
-            elif AssetRoles.OVERVIEW.value in asset.roles:
+            elif OVERVIEW_ROLE in asset.roles:
                 overview_url = self.sign_asset_href(asset.href)
 
         if overview_url:
@@ -173,6 +344,8 @@ class ResultItemWidget(QtWidgets.QWidget, WidgetUi):
 
         self.thumbnail_url = thumbnail_url \
             if thumbnail_url else overview_url
+        self.thumbnail_key = thumbnail_cache_key(self.thumbnail_url) \
+            if self.thumbnail_url else None
 
         self.view_assets_btn.setEnabled(self.item.assets is not None)
         self.view_assets_btn.clicked.connect(self.open_assets_dialog)
@@ -219,20 +392,19 @@ class ResultItemWidget(QtWidgets.QWidget, WidgetUi):
         :param url: HTTP URL
         :type url: str
 
-        :param url: URL params
-        :type url: dict
+        :param params: URL params
+        :type params: dict
 
         :returns New url updated with params
         :rtype str
         """
-        parts = list(urlparse.urlparse(url))
+        url = QtCore.QUrl(url)
+        query = QtCore.QUrlQuery(url)
+        for key, value in params.items():
+            query.addQueryItem(str(key), str(value))
+        url.setQuery(query)
 
-        query = urlparse.parse_qsl(parts[4])
-        query += params.items()
-
-        parts[4] = urlencode(query)
-
-        return urlparse.urlunparse(parts)
+        return url.toString(QtCore.QUrl.FullyEncoded)
 
     def update_inputs(self, enabled):
         """ Updates the inputs widgets state in the main search item widget.
@@ -274,108 +446,314 @@ class ResultItemWidget(QtWidgets.QWidget, WidgetUi):
 
     def add_footprint(self):
         """ Adds the item footprint inside QGIS as a map layer"""
-        layer_file = tempfile.NamedTemporaryFile(
-            mode="w+",
-            suffix='.geojson',
-            delete=False
-        )
-        layer_name = f"{self.item.id}_footprint"
-        json.dump(self.item.stac_object.to_dict(), layer_file)
+        add_footprint_helper(self.item, self.main_widget)
 
-        layer_file.flush()
+    def add_thumbnail(self):
+        """ Loads the STAC Item thumbnail, from the memory or disk cache
+        when available, otherwise downloads it.
+        """
+        thumbnail_pixmap = QtGui.QPixmapCache.find(self.thumbnail_key)
+        if thumbnail_pixmap is not None and not thumbnail_pixmap.isNull():
+            self.thumbnail_la.setPixmap(thumbnail_pixmap)
+            return
 
-        layer = QgsVectorLayer(
-            layer_file.name,
-            layer_name,
-            AssetLayerType.VECTOR.value
-        )
-        if layer.isValid():
-            QgsProject.instance().addMapLayer(layer)
-            self.main_widget.show_message(
-                tr("Successfully loaded footprint layer."),
-                level=Qgis.Info
-            )
+        cache_path = thumbnail_cache_path(self.thumbnail_key)
+        if os.path.exists(cache_path):
+            self.decode_thumbnail(path=cache_path)
+            return
 
-        else:
-            self.main_widget.show_message(
-                tr(
-                    "Couldn't load footprint into QGIS,"
-                    " its layer is not valid."
-                ),
-                level=Qgis.Critical
-            )
+        self.fetch_thumbnail()
 
-    def add_thumbnail(self):
-        """ Downloads and loads the STAC Item thumbnail"""
-        request = QtNetwork.QNetworkRequest(
-            QtCore.QUrl(
-                self.thumbnail_url
-            )
-        )
-        self.network_task(
-            request,
+    def fetch_thumbnail(self):
+        """ Downloads the STAC Item thumbnail."""
+        ThumbnailFetcher.instance().enqueue(
+            self.thumbnail_url,
             self.thumbnail_response
         )
 
     def thumbnail_response(self, content):
         """ Callback to handle the thumbnail network response.
-            Sets the thumbnail image data into the widget thumbnail label.
+            Decodes the thumbnail data, which is stored in the disk cache
+            once it has been decoded successfully.
 
         :param content: Network response data
         :type content: QByteArray
         """
-        thumbnail_image = QtGui.QImage.fromData(content)
+        self.decode_thumbnail(
+            content,
+            thumbnail_cache_path(self.thumbnail_key)
+        )
+
+    def decode_thumbnail(self, content=None, path=None):
+        """ Decodes the thumbnail image data in the thumbnails thread pool.
+        Without content the data is read from the disk cache file in path
+        and the thumbnail is downloaded again when that file can't be
+        decoded, otherwise the content is written into path after
+        it has been decoded.
+
+        :param content: Thumbnail image data
+        :type content: QByteArray
+
+        :param path: Path of the thumbnail disk cache file
+        :type path: str
+        """
+        device_pixel_ratio = self.thumbnail_la.devicePixelRatioF()
+        thumbnail_size = self.thumbnail_la.size().expandedTo(
+            self.thumbnail_la.minimumSize()
+        ) * device_pixel_ratio
+
+        thumbnail_decode = ThumbnailDecode(
+            thumbnail_size,
+            device_pixel_ratio,
+            content=content,
+            path=path
+        )
+        thumbnail_decode.signals.decoded.connect(
+            self.thumbnail_decoded,
+            QtCore.Qt.QueuedConnection
+        )
+        if content is None:
+            thumbnail_decode.signals.failed.connect(
+                self.fetch_thumbnail,
+                QtCore.Qt.QueuedConnection
+            )
+        # Keep the signals object alive until the decoded image
+        # has been delivered.
+        self.thumbnail_decode_signals = thumbnail_decode.signals
+        _thumb_pool.start(thumbnail_decode)
+
+    def thumbnail_decoded(self, thumbnail_image):
+        """ Sets the decoded thumbnail image into the widget thumbnail label.
+
+        :param thumbnail_image: Decoded thumbnail image
+        :type thumbnail_image: QImage
+        """
+        thumbnail_pixmap = QtGui.QPixmap.fromImage(thumbnail_image)
+        QtGui.QPixmapCache.insert(self.thumbnail_key, thumbnail_pixmap)
 
-        if thumbnail_image:
-            thumbnail_pixmap = QtGui.QPixmap.fromImage(thumbnail_image)
+        try:
             self.thumbnail_la.setPixmap(thumbnail_pixmap)
+        except RuntimeError:
+            # The widget was removed from the results before
+            # its thumbnail arrived.
+            pass
 
-    def network_task(
-            self,
-            request,
-            handler,
-            auth_config=""
-    ):
-        """Fetches the response from the given request.
 
-        :param request: Network request
-        :type request: QNetworkRequest
+class ThumbnailDecodeSignals(QtCore.QObject):
+    """ Signals emitted by the thumbnail decoding runnable."""
 
-        :param handler: Callback function to handle the response
-        :type handler: Callable
+    decoded = QtCore.pyqtSignal(QtGui.QImage)
+    failed = QtCore.pyqtSignal()
+
+
+class ThumbnailDecode(QtCore.QRunnable):
+    """ Reads and decodes the thumbnail image data in a background thread
+    and scales the image down to the size it is displayed with.
+
+    When no content is given the data is read from the disk cache file
+    in path, which is removed if it can't be decoded. Otherwise the
+    content is written into path once it has been decoded.
+
+    The decoded image carries the device pixel ratio of the label it is
+    displayed in, so the pixmap made from it can be cached as is.
+    """
+
+    def __init__(self, size, device_pixel_ratio, content=None, path=None):
+        super().__init__()
+        self.size = size
+        self.device_pixel_ratio = device_pixel_ratio
+        self.content = content
+        self.path = path
+        self.signals = ThumbnailDecodeSignals()
+
+    def run(self):
+        """ Decodes the image data and emits the resulting image."""
+        if self.content is None:
+            reader = QtGui.QImageReader(self.path)
+        else:
+            buffer = QtCore.QBuffer()
+            buffer.setData(self.content)
+            buffer.open(QtCore.QIODevice.ReadOnly)
+            reader = QtGui.QImageReader(buffer)
+
+        # Let the image plugin decode straight into the displayed size,
+        # JPEG images are then decoded with a scaled DCT.
+        image_size = reader.size()
+        if image_size.isValid() and \
+                (image_size.width() > self.size.width() or
+                 image_size.height() > self.size.height()):
+            reader.setScaledSize(
+                image_size.scaled(self.size, QtCore.Qt.KeepAspectRatio)
+            )
+
+        thumbnail_image = reader.read()
+
+        if thumbnail_image.isNull():
+            if self.content is None:
+                # Release the cache file before removing it.
+                del reader
+                try:
+                    os.unlink(self.path)
+                except OSError:
+                    pass
+            self.signals.failed.emit()
+            return
+
+        if self.content is not None and self.path:
+            write_thumbnail_cache(self.path, self.content)
+
+        thumbnail_image = thumbnail_image.convertToFormat(
+            QtGui.QImage.Format_ARGB32_Premultiplied
+        )
+        thumbnail_image.setDevicePixelRatio(self.device_pixel_ratio)
+        self.signals.decoded.emit(thumbnail_image)
+
+
+class ThumbnailCachePrune(QtCore.QRunnable):
+    """ Removes the least recently used thumbnails from the disk cache
+    when its total size is above the cache size limit.
+    """
+
+    def __init__(self, cache_dir, max_size=THUMBNAIL_CACHE_MAX_SIZE):
+        super().__init__()
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    def run(self):
+        """ Removes the least recently accessed cache files first."""
+        try:
+            entries = [
+                (entry.stat().st_atime, entry.stat().st_size, entry.path)
+                for entry in os.scandir(self.cache_dir)
+                if entry.is_file()
+            ]
+        except OSError:
+            return
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total_size -= size
+
+
+class ThumbnailFetcher(QtCore.QObject):
+    """ Fetches the search result items thumbnails through the shared QGIS
+    network access manager, so connections to the thumbnails hosts are kept
+    alive and reused across the result items.
+
+    Requests added during the same event loop turn are scheduled together
+    and only a limited number of them are run at a time, a thumbnail
+    that is already being fetched is not requested again.
+    """
+
+    MAX_CONCURRENT_REQUESTS = 6
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """ Returns the fetcher shared by all the result items widgets.
+
+        :returns Thumbnail fetcher instance
+        :rtype ThumbnailFetcher
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.queue = collections.deque()
+        self.replies = {}
+        self.handlers = {}
+        self.flush_scheduled = False
+
+    def enqueue(self, url, handler):
+        """ Adds the thumbnail url into the fetch queue.
+
+        :param url: Thumbnail URL
+        :type url: str
 
-        :param auth_config: Authentication configuration string
-        :type auth_config: str
+        :param handler: Callback function to handle the response content
+        :type handler: Callable
         """
-        task = QgsNetworkContentFetcherTask(
-            request,
-            authcfg=auth_config
+        if url in self.handlers:
+            self.handlers[url].append(handler)
+            return
+        self.handlers[url] = [handler]
+
+        request = QtNetwork.QNetworkRequest(QtCore.QUrl(url))
+        request.setAttribute(
+            QtNetwork.QNetworkRequest.RedirectPolicyAttribute,
+            QtNetwork.QNetworkRequest.NoLessSafeRedirectPolicy
         )
-        response_handler = partial(
-            self.response,
-            task,
-            handler
+        request.setAttribute(
+            QtNetwork.QNetworkRequest.Http2AllowedAttribute,
+            True
         )
-        task.fetched.connect(response_handler)
-        task.run()
+        request.setAttribute(
+            QtNetwork.QNetworkRequest.HttpPipeliningAllowedAttribute,
+            True
+        )
+        self.queue.append((url, request))
 
-    def response(
-            self,
-            task,
-            handler
-    ):
-        """Handle the return response
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            QtCore.QTimer.singleShot(0, self.flush)
 
-        :param task: QGIS task that fetches network content
-        :type task:  QgsNetworkContentFetcherTask
+    def flush(self):
+        """ Sends the queued requests, up to the allowed
+        number of concurrent requests.
         """
-        reply = task.reply()
-        error = reply.error()
-        if error == QtNetwork.QNetworkReply.NoError:
-            contents: QtCore.QByteArray = reply.readAll()
-            handler(contents)
+        self.flush_scheduled = False
+        manager = QgsNetworkAccessManager.instance()
+
+        while self.queue and \
+                len(self.replies) < self.MAX_CONCURRENT_REQUESTS:
+            url, request = self.queue.popleft()
+            reply = manager.get(request)
+            self.replies[reply] = url
+            reply.finished.connect(self.response)
+
+    def cancel_all(self):
+        """ Drops the queued requests and aborts the running ones,
+        used when the search results are cleared.
+        """
+        self.queue.clear()
+        self.handlers.clear()
+
+        replies = list(self.replies)
+        self.replies.clear()
+        for reply in replies:
+            reply.finished.disconnect(self.response)
+            reply.abort()
+            reply.deleteLater()
+
+    @QtCore.pyqtSlot()
+    def response(self):
+        """ Handles the finished reply and starts the next queued request."""
+        reply = self.sender()
+        handlers = self.handlers.pop(self.replies.pop(reply))
+
+        if reply.error() == _NO_ERROR:
+            content = reply.readAll()
+            for handler in handlers:
+                try:
+                    handler(content)
+                except RuntimeError:
+                    # The result item widget was removed before
+                    # its thumbnail arrived.
+                    pass
         else:
             log(tr("Problem fetching response from network"))
+        reply.deleteLater()
+
+        self.flush()
 
 
 def add_footprint_helper(item, main_widget):
@@ -387,23 +765,23 @@ def add_footprint_helper(item, main_widget):
     :param main_widget: Parent widget that the function is called from
     :type main_widget: QWidget
     """
-    layer_file = tempfile.NamedTemporaryFile(
-        mode="w+",
-        suffix='.geojson',
-        delete=False
-    )
-    layer_name = f"{item.id}_footprint"
-    json.dump(item.stac_object.to_dict(), layer_file)
-
-    layer_file.flush()
+    project = QgsProject.instance()
+    if item.footprint_layer_id and \
+            project.mapLayer(item.footprint_layer_id) is not None:
+        main_widget.show_message(
+            tr(
+                "Footprint layer for item {} is already loaded."
+            ).format(
+                item.id
+            ),
+            level=Qgis.Info
+        )
+        return
 
-    layer = QgsVectorLayer(
-        layer_file.name,
-        layer_name,
-        AssetLayerType.VECTOR.value
-    )
+    layer = footprint_layer(item)
     if layer.isValid():
-        QgsProject.instance().addMapLayer(layer)
+        project.addMapLayer(layer)
+        item.footprint_layer_id = layer.id()
         main_widget.show_message(
             tr(
                 "Successfully loaded footprint layer for item {}."
@@ -28,6 +28,54 @@ from ..utils import log
 
 from ..definitions.constants import SAS_SUBSCRIPTION_VARIABLE
 
+# Maximum number of SAS token requests sent at the same time
+MAX_TOKEN_REQUESTS = 16
+
+# Milliseconds in each of the refresh frequency time units
+REFRESH_TIME_COUNT = {
+    TimeUnits.MINUTES: 60 * 1000,
+    TimeUnits.HOURS: 60 * 60 * 1000,
+    TimeUnits.DAYS: 24 * 60 * 60 * 1000,
+}
+
+
+def refresh_due():
+    """ Checks whether the refresh frequency time has passed since the
+    last SAS token refresh, the first check only records the current
+    time as the last refresh time.
+
+    :returns Whether the SAS tokens should be refreshed
+    :rtype bool
+    """
+    last_update = settings_manager.get_value(
+        Settings.REFRESH_LAST_UPDATE,
+        None
+    )
+    current_time = QtCore.QDateTime.currentDateTime()
+
+    if not last_update:
+        settings_manager.set_value(
+            Settings.REFRESH_LAST_UPDATE,
+            current_time.toString(QtCore.Qt.ISODate)
+        )
+        return False
+
+    refresh_frequency = settings_manager.get_value(
+        Settings.REFRESH_FREQUENCY,
+        1,
+        setting_type=int
+    )
+    unit = settings_manager.get_value(
+        Settings.REFRESH_FREQUENCY_UNIT,
+        TimeUnits.MINUTES
+    )
+    last_update_date = QtCore.QDateTime.fromString(
+        last_update, QtCore.Qt.ISODate
+    )
+
+    return last_update_date.msecsTo(current_time) >= \
+        refresh_frequency * REFRESH_TIME_COUNT[unit]
+
 
 class RefreshState(enum.Enum):
     """ Represents time units."""
@@ -44,6 +92,7 @@ class SASManager(QtCore.QObject):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.refresh_task = None
 
     def refresh_started(self):
         self.token_refresh_started.emit()
@@ -54,6 +103,7 @@ class SASManager(QtCore.QObject):
             Settings.REFRESH_STATE,
             RefreshState.IDLE
         )
+        self.refresh_task = None
         self.token_refresh_finished.emit()
 
     def refresh_error(self):
@@ -62,6 +112,7 @@ class SASManager(QtCore.QObject):
             Settings.REFRESH_STATE,
             RefreshState.IDLE
         )
+        self.refresh_task = None
         self.token_refresh_error.emit()
 
     def run_refresh_task(self):
@@ -71,15 +122,26 @@ class SASManager(QtCore.QObject):
             RefreshState.IDLE
         )
 
-        if refresh_state == RefreshState.RUNNING:
+        if refresh_state == RefreshState.RUNNING or not refresh_due():
             return
 
+        settings_manager.set_value(
+            Settings.REFRESH_LAST_UPDATE,
+            QtCore.QDateTime.currentDateTime().toString(QtCore.Qt.ISODate)
+        )
+        settings_manager.set_value(
+            Settings.REFRESH_STATE,
+            RefreshState.RUNNING
+        )
+
         self.token_refresh_started.emit()
 
-        task = RefreshTask()
-        task.taskCompleted.connect(self.refresh_complete)
-        task.taskTerminated.connect(self.refresh_error)
-        task.run()
+        # Keep a reference to the task until the task manager is done
+        # with it.
+        self.refresh_task = RefreshTask()
+        self.refresh_task.taskCompleted.connect(self.refresh_complete)
+        self.refresh_task.taskTerminated.connect(self.refresh_error)
+        QgsApplication.taskManager().addTask(self.refresh_task)
 
 
 class RefreshTask(QgsTask):
@@ -102,58 +164,6 @@ class RefreshTask(QgsTask):
         """ Refreshes the current SAS token available in search results
          items store in the plugin settings.
          """
-        updated_items = []
-
-        last_update = settings_manager.get_value(
-            Settings.REFRESH_LAST_UPDATE,
-            None
-        )
-
-        refresh_frequency = settings_manager.get_value(
-            Settings.REFRESH_FREQUENCY,
-            1,
-            setting_type=int
-        )
-
-        unit = settings_manager.get_value(
-            Settings.REFRESH_FREQUENCY_UNIT,
-            TimeUnits.MINUTES
-        )
-
-        refresh_time_count = {
-            TimeUnits.MINUTES: 60000,
-            TimeUnits.HOURS: 60 * 6000,
-            TimeUnits.DAYS: 24 * 60 * 6000,
-        }
-
-        if last_update:
-            last_update_date = QtCore.QDateTime.fromString(
-                    last_update, QtCore.Qt.ISODate
-            )
-        else:
-            last_update_date = QtCore.QDateTime.currentDateTime()
-            settings_manager.set_value(
-                Settings.REFRESH_LAST_UPDATE,
-                last_update_date.toString(QtCore.Qt.ISODate)
-            )
-
-        current_time = QtCore.QDateTime.currentDateTime()
-
-        if last_update_date.msecsTo(current_time) < \
-            refresh_frequency * refresh_time_count[unit]:
-            self.cancel()
-            return
-
-        settings_manager.set_value(
-            Settings.REFRESH_LAST_UPDATE,
-            current_time.toString(QtCore.Qt.ISODate)
-        )
-
-        settings_manager.set_value(
-            Settings.REFRESH_STATE,
-            RefreshState.RUNNING
-        )
-
         connections = settings_manager.list_connections()
 
         key = os.getenv(SAS_SUBSCRIPTION_VARIABLE)
@@ -170,38 +180,57 @@ class RefreshTask(QgsTask):
         if key:
             pc.set_subscription_key(key)
 
+        connections_items = {}
+        containers = set()
         for connection in connections:
             if connection.capability == \
                     ApiCapability.SUPPORT_SAS_TOKEN:
                 settings_items = settings_manager.get_items(
                     connection.id
                 )
+                connections_items[connection.id] = settings_items
+                for items in settings_items.values():
+                    containers.update(
+                        pc.blob_containers(
+                            item.stac_object
+                            for item in items
+                            if item.stac_object
+                        )
+                    )
+
+        pc.prefetch_tokens(containers, max_workers=MAX_TOKEN_REQUESTS)
+
+        for connection in connections:
+            if connection.id in connections_items:
+                settings_items = connections_items[connection.id]
+                updated_items = {}
                 for page, items in settings_items.items():
                     for item in items:
                         if item.stac_object:
-                            stac_object = pc.sign(item.stac_object)
+                            # The item was just read from the settings,
+                            # so its stac object can be signed in place.
+                            stac_object = pc.sign_item(
+                                item.stac_object,
+                                in_place=True
+                            )
                             item.stac_object = stac_object
                             item.assets = [
                                 ResourceAsset(
                                     href=asset.href,
-                                    title=asset.title or key,
+                                    title=asset.title or asset_key,
                                     description=asset.description,
                                     type=asset.media_type,
                                     roles=asset.roles or []
                                 )
-                                for key, asset in stac_object.assets.items()
+                                for asset_key, asset in
+                                stac_object.assets.items()
                             ]
-                            updated_items.append(item)
-                    if updated_items:
-                        settings_manager.save_items(
-                            connection,
-                            updated_items,
-                            page
-                        )
-                        updated_items = []
-
-        self.cancel()
-
+                            updated_items.setdefault(page, []).append(item)
+                if updated_items:
+                    settings_manager.save_items_bulk(
+                        connection,
+                        updated_items
+                    )
 
     def finished(self, result: bool):
         """ Handle logic after task has completed.
@@ -2,6 +2,8 @@
 # flake8:noqa
 
 from planetary_computer.sas import (
+    blob_containers,
+    prefetch_tokens,
     sign,
     sign_url,
     sign_item,
@@ -14,6 +16,8 @@ from planetary_computer.settings import set_subscription_key
 from planetary_computer.version import __version__
 
 __all__ = [
+    "blob_containers",
+    "prefetch_tokens",
     "set_subscription_key",
     "sign_asset",
     "sign_assets",
@@ -1,29 +1,28 @@
 import re
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, Set, Tuple
 import warnings
 
 from functools import singledispatch
-from urllib.parse import urlparse
 import requests
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from pystac import Asset, Item, ItemCollection
 from pystac.utils import datetime_to_str
 from pystac_client import ItemSearch
 
 from planetary_computer.settings import Settings
 from planetary_computer.utils import (
-    parse_blob_url,
+    BLOB_STORAGE_DOMAIN,
+    parse_blob_url_fast,
     parse_adlfs_url,
-    is_fsspec_asset,
+    fsspec_storage_options,
     is_vrt_string,
     asset_xpr,
 )
 
 
-BLOB_STORAGE_DOMAIN = ".blob.core.windows.net"
-
-
 class SASBase(BaseModel):
     """Base model for responses."""
 
@@ -49,18 +48,40 @@ class SASToken(SASBase):
     """The Shared Access (SAS) Token that can be used to access the data
     in, for example, Azure's Python SDK"""
 
+    _expiry_timestamp: float = PrivateAttr()
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        # POSIX timestamp of the expiry, so ttl() is a float subtraction
+        self._expiry_timestamp = self.expiry.timestamp()
+
     def sign(self, href: str) -> SignedLink:
         """Signs an href with this token"""
         return SignedLink(href=f"{href}?{self.token}", expiry=self.expiry)
 
     def ttl(self) -> float:
         """Number of seconds the token is still valid for"""
-        return (self.expiry - datetime.now(timezone.utc)).total_seconds()
+        return self._expiry_timestamp - time.time()
 
 
 # Cache of signing requests so we can reuse them
-# Key is the signing URL, value is the SAS token
-TOKEN_CACHE: Dict[str, SASToken] = {}
+# Key is the storage (account, container) pair, value is the SAS token and
+# the time.monotonic() time after which the token has to be refreshed.
+# The SAS endpoint is fixed for the process, so it isn't part of the key.
+TOKEN_CACHE: Dict[Tuple[str, str], Tuple[SASToken, float]] = {}
+
+# Seconds before the token expiry when it is refreshed, in order to give
+# a small amount of buffer
+TOKEN_REFRESH_MARGIN = 60
+
+# Session shared by the token requests, keeps the connection to the SAS
+# endpoint alive between requests. The pool is sized for the concurrent
+# token prefetching.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16),
+)
 
 
 @singledispatch
@@ -119,18 +140,24 @@ def sign_url(url: str) -> str:
     Returns:
         str: The signed HREF
     """
-    parsed_url = urlparse(url.rstrip("/"))
-    if not parsed_url.netloc.endswith(BLOB_STORAGE_DOMAIN):
+    # Cheap check first, most hrefs of mixed catalogs are not blob URLs
+    if BLOB_STORAGE_DOMAIN not in url:
+        return url
+
+    blob = parse_blob_url_fast(url)
+    if blob is None:
         return url
 
-    account, container = parse_blob_url(parsed_url)
+    account, container = blob
     token = get_token(account, container)
     return token.sign(url).href
 
 
 def _repl_vrt(m: re.Match) -> str:
-    # replace all blob-storages URLs with a signed version.
-    return sign_url(m.string[slice(*m.span())])
+    # replace all blob-storages URLs with a signed version, the account
+    # and container are already captured by the expression.
+    token = get_token(m["account"], m["container"])
+    return token.sign(m.group(0)).href
 
 
 def sign_vrt_string(vrt: str) -> str:
@@ -165,23 +192,30 @@ def sign_vrt_string(vrt: str) -> str:
     ...
     </VRTDataset>
     """
+    # VRTs that only reference other sources are returned without
+    # running the expression over the whole document.
+    if BLOB_STORAGE_DOMAIN not in vrt:
+        return vrt
     return asset_xpr.sub(_repl_vrt, vrt)
 
 
 @sign.register(Item)
-def sign_item(item: Item) -> Item:
+def sign_item(item: Item, *, in_place: bool = False) -> Item:
     """Sign all assets within a PySTAC item
 
     Args:
         item (Item): The Item whose assets that will be signed
+        in_place (bool): Sign the assets of the passed Item instead of
+            a copy of it, for items that aren't used anywhere else.
 
     Returns:
         Item: A new copy of the Item where all assets' HREFs have
-        been replaced with a signed version. In addition, a "msft:expiry"
+        been replaced with a signed version, or the passed Item when
+        ``in_place`` is set. In addition, a "msft:expiry"
         property is added to the Item properties indicating the earliest
         expiry time for any assets that were signed.
     """
-    signed_item = item.clone()
+    signed_item = item if in_place else item.clone()
     for key in signed_item.assets:
         _sign_asset_in_place(signed_item.assets[key])
     return signed_item
@@ -211,23 +245,17 @@ def _sign_asset_in_place(asset: Asset) -> Asset:
         Asset: Input Asset object modified in place: the HREF is replaced
         with a signed version.
     """
-    asset.href = sign(asset.href)
-    if is_fsspec_asset(asset):
-        key: Optional[str]
-
-        for key in ["table:storage_options", "xarray:storage_options"]:
-            if key in asset.extra_fields:
-                break
-        else:
-            key = None
-
-        if key:
-            storage_options = asset.extra_fields[key]
-            account = storage_options.get("account_name")
-            container = parse_adlfs_url(asset.href)
-            if account and container:
-                token = get_token(account, container)
-                asset.extra_fields[key]["credential"] = token.token
+    # Asset hrefs are URLs, not VRT documents, so skip the type dispatch
+    # and the VRT check of sign().
+    asset.href = sign_url(asset.href)
+    storage = fsspec_storage_options(asset)
+    if storage is not None:
+        _, storage_options = storage
+        account = storage_options.get("account_name")
+        container = parse_adlfs_url(asset.href)
+        if account and container:
+            token = get_token(account, container)
+            storage_options["credential"] = token.token
     return asset
 
 
@@ -242,19 +270,25 @@ def sign_assets(item: Item) -> Item:
 
 
 @sign.register(ItemCollection)
-def sign_item_collection(item_collection: ItemCollection) -> ItemCollection:
+def sign_item_collection(
+    item_collection: ItemCollection, *, in_place: bool = False
+) -> ItemCollection:
     """Sign a PySTAC item collection
 
     Args:
         item_collection (ItemCollection): The ItemCollection whose assets will be signed
+        in_place (bool): Sign the items of the passed ItemCollection instead
+            of a copy of it, for collections that aren't used anywhere else.
 
     Returns:
         ItemCollection: A new copy of the ItemCollection where all assets'
-        HREFs for each item have been replaced with a signed version. In addition,
+        HREFs for each item have been replaced with a signed version, or the
+        passed ItemCollection when ``in_place`` is set. In addition,
         a "msft:expiry" property is added to the Item properties indicating the
         earliest expiry time for any assets that were signed.
     """
-    new = item_collection.clone()
+    new = item_collection if in_place else item_collection.clone()
+    prefetch_tokens(blob_containers(new))
     for item in new:
         for key in item.assets:
             _sign_asset_in_place(item.assets[key])
@@ -274,7 +308,66 @@ def _search_and_sign(search: ItemSearch) -> ItemCollection:
         a "msft:expiry" property is added to the Item properties indicating the
         earliest expiry time for any assets that were signed.
     """
-    return sign(search.get_all_items())
+    # The collection was just built from the search, nothing else
+    # references it so it can be signed without copying it.
+    return sign_item_collection(search.get_all_items(), in_place=True)
+
+
+def blob_containers(items: Iterable[Item]) -> Set[Tuple[str, str]]:
+    """Find the storage accounts and containers of the items blob assets
+
+    Args:
+        items (Iterable[Item]): The items whose assets are scanned
+    Returns:
+        Set[Tuple[str, str]]: The (account, container) pairs
+    """
+    containers = set()
+    for item in items:
+        for asset in item.assets.values():
+            if BLOB_STORAGE_DOMAIN not in asset.href:
+                continue
+            try:
+                blob = parse_blob_url_fast(asset.href)
+            except ValueError:
+                continue
+            if blob is not None:
+                containers.add(blob)
+    return containers
+
+
+def prefetch_tokens(
+    containers: Iterable[Tuple[str, str]], max_workers: int = 8
+) -> None:
+    """
+    Get the tokens of several containers concurrently, placing them in
+    the token cache so signing the assets afterwards doesn't wait on
+    one token request after another.
+
+    Failed requests are ignored here, they are made again and raise
+    when the assets of their container are signed.
+
+    Args:
+        containers (Iterable[Tuple[str, str]]): The (account, container) pairs
+        max_workers (int): Maximum number of token requests sent at once
+    """
+    now = time.monotonic()
+    missing = []
+    for pair in containers:
+        entry = TOKEN_CACHE.get(pair)
+        if not entry or entry[1] <= now:
+            missing.append(pair)
+
+    # A single token is fetched by the signing itself
+    if len(missing) < 2:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+        futures = [executor.submit(get_token, *pair) for pair in missing]
+        for future in futures:
+            try:
+                future.result()
+            except Exception:
+                pass
 
 
 def get_token(account_name: str, container_name: str) -> SASToken:
@@ -290,22 +383,29 @@ def get_token(account_name: str, container_name: str) -> SASToken:
     Returns:
         SASToken: the generated token
     """
+    key = (account_name, container_name)
+    entry = TOKEN_CACHE.get(key)
+
+    # Use the cached token until there's less than a minute remaining,
+    # the settings are only needed when a new token is requested.
+    if entry and entry[1] > time.monotonic():
+        return entry[0]
+
     settings = Settings.get()
     token_request_url = f"{settings.sas_url}/{account_name}/{container_name}"
-    token = TOKEN_CACHE.get(token_request_url)
-
-    # Refresh the token if there's less than a minute remaining,
-    # in order to give a small amount of buffer
-    if not token or token.ttl() < 60:
-        headers = (
-            {"Ocp-Apim-Subscription-Key": settings.subscription_key}
-            if settings.subscription_key
-            else None
-        )
-        response = requests.get(token_request_url, headers=headers)
-        response.raise_for_status()
-        token = SASToken(**response.json())
-        if not token:
-            raise ValueError(f"No token found in response: {response.json()}")
-        TOKEN_CACHE[token_request_url] = token
+
+    headers = (
+        {"Ocp-Apim-Subscription-Key": settings.subscription_key}
+        if settings.subscription_key
+        else None
+    )
+    response = _SESSION.get(token_request_url, headers=headers, timeout=30)
+    response.raise_for_status()
+    token = SASToken(**response.json())
+    if not token:
+        raise ValueError(f"No token found in response: {response.json()}")
+    TOKEN_CACHE[key] = (
+        token,
+        time.monotonic() + token.ttl() - TOKEN_REFRESH_MARGIN,
+    )
     return token
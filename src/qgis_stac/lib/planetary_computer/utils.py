@@ -6,6 +6,9 @@ from urllib.parse import ParseResult, urlunparse, urlparse
 import pystac
 
 
+BLOB_STORAGE_DOMAIN = ".blob.core.windows.net"
+
+
 def parse_blob_url(parsed_url: ParseResult) -> Tuple[str, str]:
     """Find the account and container in a blob URL
 
@@ -30,6 +33,41 @@ def parse_blob_url(parsed_url: ParseResult) -> Tuple[str, str]:
     return account_name, container_name
 
 
+def parse_blob_url_fast(url: str) -> Optional[Tuple[str, str]]:
+    """Find the account and container in a blob URL string
+
+    URLs shaped like ``https://{account}.blob.core.windows.net/{container}/{blob}``
+    are handled with plain string scans, any other URL goes through
+    ``urlparse`` and ``parse_blob_url``.
+
+    Parameters
+    ----------
+    url: str
+        URL to extract information from
+
+    Returns
+    -------
+    Tuple of the account name and container name, None when the URL host
+    is not in the blob storage domain.
+    """
+    url = url.rstrip("/")
+    if url.startswith("https://"):
+        host_end = url.find("/", 8)
+        container_end = url.find("/", host_end + 1) if host_end != -1 else -1
+        if container_end > host_end + 1:
+            netloc = url[8:host_end]
+            head = url[8:container_end]
+            if not any(c in head for c in "?#@:"):
+                if not netloc.endswith(BLOB_STORAGE_DOMAIN):
+                    return None
+                return netloc.split(".", 1)[0], url[host_end + 1 : container_end]
+
+    parsed_url = urlparse(url)
+    if not parsed_url.netloc.endswith(BLOB_STORAGE_DOMAIN):
+        return None
+    return parse_blob_url(parsed_url)
+
+
 def parse_adlfs_url(url: str) -> Optional[str]:
     """
     Extract the storage container from an adlfs URL.
@@ -49,6 +87,27 @@ def parse_adlfs_url(url: str) -> Optional[str]:
     return None
 
 
+FSSPEC_STORAGE_OPTIONS_KEYS = ("table:storage_options", "xarray:storage_options")
+
+
+def fsspec_storage_options(asset: pystac.Asset) -> Optional[Tuple[str, dict]]:
+    """
+    Find the fsspec storage options of an Asset.
+
+    Returns
+    -------
+    Tuple of the extra field key and the storage options dict of the first
+    "table:storage_options" or "xarray:storage_options" field that contains
+    an "account_name", None when there isn't any.
+    """
+    extra_fields = asset.extra_fields
+    for key in FSSPEC_STORAGE_OPTIONS_KEYS:
+        storage_options = extra_fields.get(key)
+        if storage_options is not None and "account_name" in storage_options:
+            return key, storage_options
+    return None
+
+
 def is_fsspec_asset(asset: pystac.Asset) -> bool:
     """
     Determine if an Asset points to an fsspec URL.
@@ -56,21 +115,31 @@ def is_fsspec_asset(asset: pystac.Asset) -> bool:
     This checks if "account_name" is present in the asset's "table:storage_options"
     or "xarray:storage_options" fields.
     """
-    return "account_name" in asset.extra_fields.get(
-        "table:storage_options", {}
-    ) or "account_name" in asset.extra_fields.get("xarray:storage_options", {})
+    return fsspec_storage_options(asset) is not None
 
 
 def is_vrt_string(s: str) -> bool:
     """
     Check whether a string looks like a VRT
     """
-    return s.strip().startswith("<VRTDataset") and s.strip().endswith("</VRTDataset>")
-
-
+    # Skip the surrounding whitespace by index instead of stripping,
+    # VRT strings can be large and strip() copies them.
+    start = 0
+    end = len(s)
+    while start < end and s[start].isspace():
+        start += 1
+    while end > start and s[end - 1].isspace():
+        end -= 1
+    return s.startswith("<VRTDataset", start, end) and s.endswith(
+        "</VRTDataset>", start, end
+    )
+
+
+# Blob storage URLs inside VRT strings, the character classes stop at the
+# delimiters found around URLs in XML so no backtracking is needed.
 asset_xpr = re.compile(
-    r"https://(?P<account>[A-z0-9]+?)"
+    r"https://(?P<account>[A-Za-z0-9]+)"
     r"\.blob\.core\.windows\.net/"
-    r"(?P<container>.+?)"
-    r"/(?P<blob>[^<]+)"
+    r"(?P<container>[^/\s\"<>]+)"
+    r"/(?P<blob>[^\s\"<>]+)"
 )
@@ -34,6 +34,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The conformance class patterns are fixed, compile them only once.
+CONFORMANCE_PATTERNS = {
+    name: re.compile(regex) for name, regex in CONFORMANCE_URIS.items()
+}
+
 
 class StacApiIO(DefaultStacIO):
     def __init__(
@@ -247,14 +252,12 @@ class StacApiIO(DefaultStacIO):
         if self._conformance is None:
             return True
 
-        class_regex = CONFORMANCE_URIS.get(conformance_class.name, None)
+        pattern = CONFORMANCE_PATTERNS.get(conformance_class.name, None)
 
-        if class_regex is None:
+        if pattern is None:
             raise Exception(f"Invalid conformance class {conformance_class}")
 
-        pattern = re.compile(class_regex)
-
-        if not any(re.match(pattern, uri) for uri in self._conformance):
+        if not any(pattern.match(uri) for uri in self._conformance):
             return False
 
         return True
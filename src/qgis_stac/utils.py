@@ -4,6 +4,7 @@
 """
 
 import datetime
+import functools
 import os
 import subprocess
 import sys
@@ -22,6 +23,11 @@ from .conf import (
 
 from .definitions.catalog import CATALOGS, SITE
 
+# Default catalogs along with their parsed connection identifiers
+DEFAULT_CATALOGS = [
+    (uuid.UUID(catalog['id']), catalog) for catalog in CATALOGS
+]
+
 
 def tr(message):
     """Get the translation for a string using Qt translation API.
@@ -74,9 +80,7 @@ def config_defaults_catalogs():
     catalogs and set the current connection active.
     """
 
-    for catalog in CATALOGS:
-        connection_id = uuid.UUID(catalog['id'])
-
+    for connection_id, catalog in DEFAULT_CATALOGS:
         capability = ApiCapability(catalog["capability"]) \
             if catalog["capability"] else None
         if not settings_manager.is_connection(
@@ -123,14 +127,27 @@ def open_folder(path):
         return False, tr('No read or write permission on path: {}').format(path)
 
     if sys.platform == 'darwin':
-        subprocess.check_call(['open', path])
+        command = 'open'
     elif sys.platform in ['linux', 'linux1', 'linux2']:
-        subprocess.check_call(['xdg-open', path])
+        command = 'xdg-open'
     elif sys.platform == 'win32':
-        subprocess.check_call(['explorer', path])
+        command = 'explorer'
     else:
         raise NotImplementedError
 
+    # The file manager is started without waiting for it, so the
+    # QGIS interface is not blocked while it opens.
+    try:
+        subprocess.Popen(
+            [command, path],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+        )
+    except OSError as e:
+        return False, tr('Could not open path {}, {}').format(path, e)
+
     return True, tr("Success")
 
 
@@ -141,14 +158,29 @@ def open_documentation():
     )
 
 
+@functools.lru_cache(maxsize=1)
+def gdal_version():
+    """ Returns the installed gdal version, GDAL is only queried
+    the first time.
+
+    :returns Release name and version number
+    :rtype tuple
+    """
+    return (
+        gdal.VersionInfo("RELEASE_NAME"),
+        int(gdal.VersionInfo("VERSION_NUM"))
+    )
+
+
 def check_gdal_version():
     """ Checks if the installed gdal version matches the
     required version by the plugin
     """
-    gdal_version = gdal.VersionInfo("RELEASE_NAME")
-    if int(gdal.VersionInfo("VERSION_NUM")) < 1000000:
+    release_name, version_num = gdal_version()
+    if version_num < 1000000:
         msg = tr(
             "Make sure you are using GDAL >= 1.10 "
-            "You seem to have gdal {} installed".format(gdal_version))
+            "You seem to have gdal {} installed"
+        ).format(release_name)
         log(msg)
 
@@ -1,5 +1,6 @@
 import os
 import requests
+import time
 
 import multiprocessing
 
@@ -10,6 +11,20 @@ from .stac_api_server_app import app
 from .stac_api_auth_server_app import app as auth_app
 
 
+def server_process(app_server):
+    """ Creates the process that runs the given mock server.
+
+    Forking lets the child reuse the modules already imported by the
+    tests instead of importing them again, platforms without fork use
+    their default start method.
+    """
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        context = multiprocessing.get_context()
+    return context.Process(target=app_server.run)
+
+
 class MockSTACApiServer(Thread):
     """ Mock a live """
     def __init__(self, port=5000, auth=False):
@@ -38,5 +53,19 @@ class MockSTACApiServer(Thread):
         requests.get("http://localhost:%s/shutdown" % self.port)
         self.join()
 
+    def wait_until_ready(self, timeout=5):
+        """ Polls the server root until it answers, so tests don't spend
+        their signal wait time on the server startup.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                requests.get(self.url, timeout=0.5)
+                return
+            except requests.ConnectionError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.05)
+
     def run(self):
         self.app.run(port=self.port)
@@ -1,21 +1,21 @@
-import json
 import sys
 
 from pathlib import Path
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 
 app = Flask(__name__)
 
 DATA_PATH = Path(__file__).parent / "data"
 
+# The mock data never changes, load it once instead of on every request.
+CATALOG_BODY = (DATA_PATH / "catalog.json").read_bytes()
+COLLECTIONS_BODY = (DATA_PATH / "collections.json").read_bytes()
+
 
 @app.route("/")
 def catalog():
-    catalog = DATA_PATH / "catalog.json"
-
-    with catalog.open() as fl:
-        return json.load(fl)
+    return Response(CATALOG_BODY, mimetype="application/json")
 
 
 @app.route("/collections")
@@ -23,8 +23,6 @@ def collections():
     headers = request.headers
     auth = headers.get("APIHeaderKey")
     if auth == 'test_api_header_key':
-        collections = DATA_PATH / "collections.json"
-        with collections.open() as fl:
-            return json.load(fl)
+        return Response(COLLECTIONS_BODY, mimetype="application/json")
     else:
         return jsonify({"message": "Unauthorized"}), 401
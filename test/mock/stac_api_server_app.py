@@ -1,101 +1,110 @@
-import json
 import sys
 
 from pathlib import Path
 
-from flask import Flask, request
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    import json
+
+    from json import loads as json_loads
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
+from flask import Flask, Response, request
 
 app = Flask(__name__)
 
 DATA_PATH = Path(__file__).parent / "data"
 
 
+def load_fixture(name):
+    """ Parses the JSON mock data file with the given name."""
+    return json_loads((DATA_PATH / name).read_bytes())
+
+
+# The mock data never changes, keep the serialised responses in memory
+# instead of building them on every request.
+CATALOG_BODY = (DATA_PATH / "catalog.json").read_bytes()
+COLLECTIONS_BODY = (DATA_PATH / "collections.json").read_bytes()
+COLLECTION_BODY = (DATA_PATH / "collection.json").read_bytes()
+CONFORMANCE_BODY = (DATA_PATH / "conformance.json").read_bytes()
+SEARCH_BODY = (DATA_PATH / "search.json").read_bytes()
+SEARCH_SORTED_BODY = (DATA_PATH / "search_sorted.json").read_bytes()
+
+FIRST_ITEM = load_fixture("first_item.json")
+SECOND_ITEM = load_fixture("second_item.json")
+THIRD_ITEM = load_fixture("third_item.json")
+FOURTH_ITEM = load_fixture("fourth_item.json")
+
+ITEMS_SORTED_BODY = json_dumps({
+    "type": "FeatureCollection",
+    "features": [FIRST_ITEM, SECOND_ITEM, THIRD_ITEM, FOURTH_ITEM]
+})
+ITEMS_UNSORTED_BODY = json_dumps({
+    "type": "FeatureCollection",
+    "features": [THIRD_ITEM, FOURTH_ITEM, FIRST_ITEM, SECOND_ITEM]
+})
+
+
+def json_response(body):
+    """ Wraps the already serialised JSON body into a response."""
+    return Response(body, mimetype="application/json")
+
+
+def sort_requested():
+    """ Checks whether the current request asks for the items to be
+    sorted by id in ascending order.
+    """
+    if request.method != 'POST':
+        return False
+
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        return False
+
+    sort_params = body.get('sortby')
+    if not isinstance(sort_params, list) or not sort_params or \
+            not isinstance(sort_params[0], dict):
+        return False
+
+    return sort_params[0].get('field') == 'id' and \
+        sort_params[0].get('direction') == 'asc'
+
+
 @app.route("/")
 def catalog():
-    catalog = DATA_PATH / "catalog.json"
-
-    with catalog.open() as fl:
-        return json.load(fl)
+    return json_response(CATALOG_BODY)
 
 
 @app.route("/collections")
 def collections():
-    collections = DATA_PATH / "collections.json"
-
-    with collections.open() as fl:
-        return json.load(fl)
+    return json_response(COLLECTIONS_BODY)
 
 
 @app.route("/collections/<collection_id>")
 def collection(collection_id):
     if collection_id == "simple-collection":
-        collection = DATA_PATH / "collection.json"
-
-        with collection.open() as fl:
-            return json.load(fl)
+        return json_response(COLLECTION_BODY)
 
 
 @app.route("/collections/<collection_id>/items", methods=['GET', 'POST'])
 def items(collection_id):
-    items_dict = {}
     if collection_id == "simple-collection":
-        items_dict = {
-            "type": "FeatureCollection",
-            "features": []
-        }
-        sort_requested = False
-
-        if request.method == 'POST':
-            sort_params = request.json.get('sortby')
-            sort_requested = sort_params is not None and (
-                    sort_params[0].get('field') == 'id' and
-                    sort_params[0].get('direction') == 'asc'
-            )
-
-        if sort_requested:
-            files = [
-                DATA_PATH / "first_item.json",
-                DATA_PATH / "second_item.json",
-                DATA_PATH / "third_item.json",
-                DATA_PATH / "fourth_item.json",
-            ]
-        else:
-            files = [
-                DATA_PATH / "third_item.json",
-                DATA_PATH / "fourth_item.json",
-                DATA_PATH / "first_item.json",
-                DATA_PATH / "second_item.json",
-            ]
-
-        for f in files:
-            with f.open() as fl:
-                item = json.load(fl)
-                items_dict["features"].append(item)
-    return items_dict
+        return json_response(
+            ITEMS_SORTED_BODY if sort_requested() else ITEMS_UNSORTED_BODY
+        )
+    return {}
 
 
 @app.route("/search", methods=['GET', 'POST'])
 def search():
-    sort_requested = False
-
-    if request.method == 'POST':
-        sort_params = request.json.get('sortby')
-        sort_requested = sort_params is not None and (
-                sort_params[0].get('field') == 'id' and
-                sort_params[0].get('direction') == 'asc'
-        )
-    if sort_requested:
-        search_file = DATA_PATH / "search_sorted.json"
-    else:
-        search_file = DATA_PATH / "search.json"
-
-    with search_file.open() as fl:
-        return json.load(fl)
+    return json_response(
+        SEARCH_SORTED_BODY if sort_requested() else SEARCH_BODY
+    )
 
 
 @app.route("/conformance", methods=['GET'])
 def conformance():
-    conformance_file = DATA_PATH / "conformance.json"
-
-    with conformance_file.open() as fl:
-        return json.load(fl)
+    return json_response(CONFORMANCE_BODY)
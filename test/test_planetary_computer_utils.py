@@ -0,0 +1,143 @@
+# coding=utf-8
+"""Tests for the Planetary Computer blob URL and VRT parsing helpers.
+
+"""
+
+import unittest
+
+from urllib.parse import urlparse
+
+from qgis_stac.lib.planetary_computer.utils import (
+    BLOB_STORAGE_DOMAIN,
+    asset_xpr,
+    is_vrt_string,
+    parse_blob_url,
+    parse_blob_url_fast,
+)
+
+
+def parse_blob_url_reference(url):
+    """ Parses the blob URL the way it was done before the string
+    scans fast path, used as the expected result.
+    """
+    parsed_url = urlparse(url.rstrip("/"))
+    if not parsed_url.netloc.endswith(BLOB_STORAGE_DOMAIN):
+        return None
+    return parse_blob_url(parsed_url)
+
+
+class PlanetaryComputerUtilsTest(unittest.TestCase):
+    """Test the Planetary Computer parsing helpers"""
+
+    def test_parse_blob_url_fast(self):
+        """Fast blob URL parsing matches the urlparse based parsing"""
+
+        urls = [
+            "https://account.blob.core.windows.net/container/blob.tif",
+            "https://account.blob.core.windows.net/container/a/b/c.tif",
+            "https://account.blob.core.windows.net/container/blob.tif/",
+            "https://account.blob.core.windows.net/container/blob?st=1",
+            "https://account.blob.core.windows.net/container/blob#part",
+            "https://account.blob.core.windows.net:443/container/blob",
+            "https://user@account.blob.core.windows.net/container/blob",
+            "http://account.blob.core.windows.net/container/blob.tif",
+            "https://example.com/container/blob.tif",
+            "https://example.com/",
+            "abfs://container/blob.parquet",
+        ]
+        for url in urls:
+            self.assertEqual(
+                parse_blob_url_fast(url),
+                parse_blob_url_reference(url),
+                url
+            )
+
+        self.assertEqual(
+            parse_blob_url_fast(
+                "http://account.blob.core.windows.net/container/blob.tif"
+            ),
+            ("account", "container")
+        )
+        # The host check is done on the whole network location,
+        # so URLs with an explicit port are not signed.
+        self.assertIsNone(
+            parse_blob_url_fast(
+                "https://account.blob.core.windows.net:443/container/blob"
+            )
+        )
+        self.assertIsNone(
+            parse_blob_url_fast("https://example.com/container/blob.tif")
+        )
+
+    def test_parse_blob_url_fast_missing_container(self):
+        """Blob URLs without a container are invalid"""
+
+        for url in [
+            "https://account.blob.core.windows.net/blob.tif",
+            "https://account.blob.core.windows.net/",
+            "https://account.blob.core.windows.net",
+        ]:
+            with self.assertRaises(ValueError):
+                parse_blob_url_fast(url)
+
+    def test_is_vrt_string(self):
+        """VRT strings are detected regardless of surrounding whitespace"""
+
+        vrt = "<VRTDataset rasterXSize=\"1\"></VRTDataset>"
+
+        self.assertTrue(is_vrt_string(vrt))
+        self.assertTrue(is_vrt_string(f"\n  {vrt}\t\n"))
+        self.assertFalse(is_vrt_string(""))
+        self.assertFalse(is_vrt_string("   "))
+        self.assertFalse(is_vrt_string("<VRTDataset>"))
+        self.assertFalse(
+            is_vrt_string("https://account.blob.core.windows.net/c/b.tif")
+        )
+        self.assertFalse(is_vrt_string(f"x{vrt}"))
+
+    def test_vrt_href_extraction(self):
+        """Blob URLs are extracted from the VRT up to their delimiters"""
+
+        vrt = (
+            "<VRTDataset>\n"
+            "  <SourceFilename relativeToVRT=\"0\">"
+            "/vsicurl/https://account.blob.core.windows.net/"
+            "container/a/b.tif</SourceFilename>\n"
+            "  <Metadata href=\"https://other.blob.core.windows.net/"
+            "data/c.tif?x=1\"/>\n"
+            "  <Description>https://example.com/data/d.tif "
+            "https://third.blob.core.windows.net/logs/e.txt more</Description>"
+            "\n</VRTDataset>"
+        )
+        matches = [
+            (m["account"], m["container"], m["blob"], m.group(0))
+            for m in asset_xpr.finditer(vrt)
+        ]
+
+        self.assertEqual(
+            matches,
+            [
+                (
+                    "account",
+                    "container",
+                    "a/b.tif",
+                    "https://account.blob.core.windows.net/container/a/b.tif"
+                ),
+                (
+                    "other",
+                    "data",
+                    "c.tif?x=1",
+                    "https://other.blob.core.windows.net/data/c.tif?x=1"
+                ),
+                (
+                    "third",
+                    "logs",
+                    "e.txt",
+                    "https://third.blob.core.windows.net/logs/e.txt"
+                ),
+            ]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
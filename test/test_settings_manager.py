@@ -9,7 +9,14 @@ import uuid
 
 
 from qgis_stac.conf import settings_manager
-from qgis_stac.conf import ConnectionSettings
+from qgis_stac.conf import ConnectionSettings, ItemSettings
+
+
+def truncate_seconds(date):
+    """ Drops the seconds from the date, the stored connection dates
+    are only compared up to the minute.
+    """
+    return date.replace(second=0, microsecond=0)
 
 
 class SettingsManagerTest(unittest.TestCase):
@@ -91,8 +98,8 @@ class SettingsManagerTest(unittest.TestCase):
         )
 
         self.assertEqual(
-            connection.created_date.replace(second=0, microsecond=0),
-            stored_connection.created_date.replace(second=0, microsecond=0)
+            truncate_seconds(connection.created_date),
+            truncate_seconds(stored_connection.created_date)
         )
 
         # Adding a second connection, setting it a current selected
@@ -122,8 +129,8 @@ class SettingsManagerTest(unittest.TestCase):
         )
 
         self.assertEqual(
-            second_connection.created_date.replace(second=0, microsecond=0),
-            second_stored_connection.created_date.replace(second=0, microsecond=0)
+            truncate_seconds(second_connection.created_date),
+            truncate_seconds(second_stored_connection.created_date)
         )
         settings_manager.set_current_connection(
             second_connection_id
@@ -140,8 +147,8 @@ class SettingsManagerTest(unittest.TestCase):
         )
 
         self.assertEqual(
-            second_connection.created_date.replace(second=0, microsecond=0),
-            current_connection.created_date.replace(second=0, microsecond=0)
+            truncate_seconds(second_connection.created_date),
+            truncate_seconds(current_connection.created_date)
         )
 
         # Retrieve all the connections
@@ -158,3 +165,54 @@ class SettingsManagerTest(unittest.TestCase):
         settings_manager.delete_connection(second_connection_id)
         connections = settings_manager.list_connections()
         self.assertEqual(len(connections), 1)
+
+    def test_items_settings(self):
+        """Items of several result pages can be saved and retrieved"""
+
+        connection = ConnectionSettings(
+            id=uuid.uuid4(),
+            name="items_test_connection",
+            url="http:://items_test",
+            page_size=10,
+            collections=[],
+            conformances=[],
+            capability=None,
+            sas_subscription_key=None,
+            search_items=None,
+        )
+
+        pages_items = {
+            "1": [
+                ItemSettings(item_uuid=uuid.uuid4(), id="first_item"),
+                ItemSettings(item_uuid=uuid.uuid4(), id="second_item"),
+            ],
+            "2": [
+                ItemSettings(item_uuid=uuid.uuid4(), id="third_item"),
+            ],
+        }
+        settings_manager.save_items_bulk(connection, pages_items)
+
+        stored_items = settings_manager.get_items(connection.id)
+
+        self.assertEqual(set(stored_items.keys()), {"1", "2"})
+        for page, items in pages_items.items():
+            self.assertEqual(
+                sorted(
+                    (str(item.item_uuid), item.id)
+                    for item in stored_items[page]
+                ),
+                sorted((str(item.item_uuid), item.id) for item in items)
+            )
+
+        # Saving a single page goes through the same settings path
+        fourth_item = ItemSettings(item_uuid=uuid.uuid4(), id="fourth_item")
+        settings_manager.save_items(connection, [fourth_item], "3")
+
+        stored_items = settings_manager.get_items(connection.id)
+        self.assertEqual(
+            [item.id for item in stored_items["3"]],
+            ["fourth_item"]
+        )
+
+        settings_manager.delete_connection(connection.id)
+        self.assertEqual(settings_manager.get_items(connection.id), {})
@@ -5,9 +5,7 @@
 import unittest
 import logging
 
-from multiprocessing import Process
-
-from mock.mock_http_server import MockSTACApiServer
+from mock.mock_http_server import MockSTACApiServer, server_process
 from qgis.PyQt.QtTest import QSignalSpy
 
 from qgis_stac.api.client import Client
@@ -17,14 +15,16 @@ from qgis.core import QgsAuthMethodConfig
 
 class STACApiClientAuthTest(unittest.TestCase):
 
-    def setUp(self):
-        self.app_server = MockSTACApiServer(auth=True)
+    @classmethod
+    def setUpClass(cls):
+        cls.app_server = MockSTACApiServer(auth=True)
 
-        self.server = Process(target=self.app_server.run)
-        self.server.start()
+        cls.server = server_process(cls.app_server)
+        cls.server.start()
+        cls.app_server.wait_until_ready()
 
+    def setUp(self):
         self.api_client = Client(self.app_server.url)
-        self.response = None
         self.error = None
 
     def set_auth_method(
@@ -64,16 +64,14 @@ class STACApiClientAuthTest(unittest.TestCase):
         )
 
         spy = QSignalSpy(api_client.collections_received)
-        api_client.collections_received.connect(self.app_response)
         api_client.error_received.connect(self.error_response)
 
         api_client.get_collections()
         result = spy.wait(timeout=1000)
 
         self.assertTrue(result)
-        self.assertIsNotNone(self.response)
         self.assertIsNone(self.error)
-        self.assertEqual(len(self.response), 2)
+        self.assertEqual(len(spy[0]), 2)
 
         cfg_id = self.set_auth_method(
             "STAC_API_AUTH_TEST",
@@ -87,24 +85,23 @@ class STACApiClientAuthTest(unittest.TestCase):
         )
 
         spy = QSignalSpy(api_client.collections_received)
-        api_client.collections_received.connect(self.app_response)
+        error_spy = QSignalSpy(api_client.error_received)
         api_client.error_received.connect(self.error_response)
 
         api_client.get_collections()
-        result = spy.wait(timeout=1000)
+        result = error_spy.wait(timeout=1000)
 
-        self.assertFalse(result)
+        self.assertTrue(result)
+        self.assertEqual(len(spy), 0)
         self.assertIsNotNone(self.error)
 
-    def app_response(self, *response_args):
-        self.response = response_args
-
     def error_response(self, *response_args):
         self.error = response_args
 
-    def tearDown(self):
-        self.server.terminate()
-        self.server.join()
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.terminate()
+        cls.server.join()
 
 
 if __name__ == '__main__':
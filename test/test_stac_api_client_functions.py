@@ -5,40 +5,40 @@
 import unittest
 import logging
 
-from multiprocessing import Process
-
-from mock.mock_http_server import MockSTACApiServer
+from mock.mock_http_server import MockSTACApiServer, server_process
 from qgis.PyQt.QtTest import QSignalSpy
 
 from qgis_stac.api.client import Client
 from qgis_stac.api.models import ItemSearch, SortField, SortOrder
 
+_LOG = logging.getLogger(__name__)
 
-class STACApiClientTest(unittest.TestCase):
 
-    def setUp(self):
+class STACApiClientTest(unittest.TestCase):
 
-        self.app_server = MockSTACApiServer()
+    @classmethod
+    def setUpClass(cls):
+        cls.app_server = MockSTACApiServer()
 
-        self.server = Process(target=self.app_server.run)
-        self.server.start()
+        cls.server = server_process(cls.app_server)
+        cls.server.start()
+        cls.app_server.wait_until_ready()
 
+    def setUp(self):
         self.api_client = Client(self.app_server.url)
-        self.response = None
         self.error = None
 
     def test_resources_fetch(self):
         # check items searching
         spy = QSignalSpy(self.api_client.items_received)
-        self.api_client.items_received.connect(self.app_response)
         self.api_client.get_items(ItemSearch(collections=['simple-collection']))
         result = spy.wait(timeout=1000)
 
         self.assertTrue(result)
-        self.assertIsNotNone(self.response)
-        self.assertEqual(len(self.response), 2)
+        response = spy[0]
+        self.assertEqual(len(response), 2)
 
-        items = self.response[0]
+        items = response[0]
 
         self.assertEqual(len(items), 4)
         self.assertEqual(items[0].id, "20201211_223832_CS3")
@@ -47,7 +47,6 @@ class STACApiClientTest(unittest.TestCase):
     def test_items_sort(self):
         # check items searching with sorting enabled
         spy = QSignalSpy(self.api_client.items_received)
-        self.api_client.items_received.connect(self.app_response)
 
         self.api_client.get_items(
             ItemSearch(
@@ -59,9 +58,9 @@ class STACApiClientTest(unittest.TestCase):
         result = spy.wait(timeout=1000)
 
         self.assertTrue(result)
-        self.assertIsNotNone(self.response)
-        self.assertEqual(len(self.response), 2)
-        items = self.response[0]
+        response = spy[0]
+        self.assertEqual(len(response), 2)
+        items = response[0]
 
         self.assertEqual(len(items), 4)
         self.assertEqual(items[0].id, "20201211_223832_CS1")
@@ -71,14 +70,13 @@ class STACApiClientTest(unittest.TestCase):
 
         api_client = Client(self.app_server.url)
         spy = QSignalSpy(api_client.collections_received)
-        api_client.collections_received.connect(self.app_response)
         api_client.get_collections()
         result = spy.wait(timeout=1000)
 
         self.assertTrue(result)
-        self.assertIsNotNone(self.response)
-        self.assertEqual(len(self.response), 2)
-        collections = self.response[0]
+        response = spy[0]
+        self.assertEqual(len(response), 2)
+        collections = response[0]
 
         self.assertEqual(len(collections), 1)
         self.assertEqual(collections[0].id, "simple-collection")
@@ -87,15 +85,14 @@ class STACApiClientTest(unittest.TestCase):
     def test_conformance_search(self):
         # check conformance fetching
         spy = QSignalSpy(self.api_client.conformance_received)
-        self.api_client.conformance_received.connect(self.app_response)
         self.api_client.get_conformance()
         result = spy.wait(timeout=1000)
 
         self.assertTrue(result)
-        self.assertIsNotNone(self.response)
-        self.assertEqual(len(self.response), 2)
+        response = spy[0]
+        self.assertEqual(len(response), 2)
 
-        conformance_classes = self.response[0]
+        conformance_classes = response[0]
 
         self.assertEqual(len(conformance_classes), 16)
         self.assertEqual(conformance_classes[0].name, 'core')
@@ -104,16 +101,14 @@ class STACApiClientTest(unittest.TestCase):
             "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/core"
         )
 
-    def app_response(self, *response_args):
-        self.response = response_args
-
     def error_response(self, *response_args):
         self.error = response_args
-        logging(0, self.error)
+        _LOG.error("STAC API error: %s", response_args)
 
-    def tearDown(self):
-        self.server.terminate()
-        self.server.join()
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.terminate()
+        cls.server.join()
 
 
 if __name__ == '__main__':